@@ -10,13 +10,16 @@
 
 import os
 import shutil
-import subprocess
 import yaml
 import mistlib as mist
 import pandas as pd
 import numpy as np
 from myna.core.app.base import MynaApp
-from myna.application.openfoam.mesh import update_parameter
+from myna.application.openfoam.mesh import (
+    get_parameter,
+    update_parameter,
+    update_parameters,
+)
 
 
 class AdditiveFOAM(MynaApp):
@@ -80,24 +83,14 @@ class AdditiveFOAM(MynaApp):
 
         # Update the base material laser absorption for the heat source
         absorption = mat.get_property("laser_absorption", None, None)
-        absorption_model = (
-            subprocess.check_output(
-                "foamDictionary -entry beam/absorptionModel -value "
-                + f"{case_dir}/constant/heatSourceDict",
-                shell=True,
-            )
-            .decode("utf-8")
-            .strip()
-        )
-        update_parameter(
-            f"{case_dir}/constant/heatSourceDict",
-            f"beam/{absorption_model}Coeffs/eta0",
-            absorption,
-        )
-        update_parameter(
-            f"{case_dir}/constant/heatSourceDict",
-            f"beam/{absorption_model}Coeffs/etaMin",
-            absorption,
+        heat_source_dict = f"{case_dir}/constant/heatSourceDict"
+        absorption_model = get_parameter(heat_source_dict, "beam/absorptionModel")
+        update_parameters(
+            heat_source_dict,
+            {
+                f"beam/{absorption_model}Coeffs/eta0": absorption,
+                f"beam/{absorption_model}Coeffs/etaMin": absorption,
+            },
         )
 
         # Update the isotherm in the ExaCA function dictionary if it exists
@@ -138,30 +131,17 @@ class AdditiveFOAM(MynaApp):
         )
 
         # Get heatSourceModel
-        heat_source_model = (
-            subprocess.check_output(
-                "foamDictionary -entry beam/heatSourceModel -value "
-                + f"{case_dir}/constant/heatSourceDict",
-                shell=True,
-            )
-            .decode("utf-8")
-            .strip()
-        )
+        heat_source_dict = f"{case_dir}/constant/heatSourceDict"
+        heat_source_model = get_parameter(heat_source_dict, "beam/heatSourceModel")
 
         # 2. Get heatSourceModelCoeffs/dimensions
-        heat_source_dimensions = (
-            subprocess.check_output(
-                f"foamDictionary -entry beam/{heat_source_model}Coeffs/dimensions -value "
-                + f"{case_dir}/constant/heatSourceDict",
-                shell=True,
-            )
-            .decode("utf-8")
-            .strip()
+        heat_source_dimensions = get_parameter(
+            heat_source_dict, f"beam/{heat_source_model}Coeffs/dimensions"
         )
         heat_source_dimensions = (
             heat_source_dimensions.replace("(", "").replace(")", "").strip()
         )
-        heat_source_dimensions = [float(x) for x in heat_source_dimensions.split(" ")]
+        heat_source_dimensions = [float(x) for x in heat_source_dimensions.split()]
 
         # 3. Modify X- and Y-dimensions
         heat_source_dimensions[:2] = [spot_size, spot_size]
@@ -175,7 +155,7 @@ class AdditiveFOAM(MynaApp):
             .replace(",", "")
         )
         update_parameter(
-            f"{case_dir}/constant/heatSourceDict",
+            heat_source_dict,
             f"beam/{heat_source_model}Coeffs/dimensions",
             heat_source_dim_string,
         )
@@ -246,12 +226,13 @@ class AdditiveFOAM(MynaApp):
             start_time: start time of the simulation
             end_time: end time of the simulation
         """
-        update_parameter(f"{case_dir}/system/controlDict", "startTime", start_time)
-        update_parameter(f"{case_dir}/system/controlDict", "endTime", end_time)
-        update_parameter(
+        update_parameters(
             f"{case_dir}/system/controlDict",
-            "writeInterval",
-            np.round(0.5 * (end_time - start_time), 5),
+            {
+                "startTime": start_time,
+                "endTime": end_time,
+                "writeInterval": np.round(0.5 * (end_time - start_time), 5),
+            },
         )
         source = os.path.abspath(os.path.join(case_dir, "0"))
         target = os.path.abspath(os.path.join(case_dir, f"{start_time}"))
@@ -24,6 +24,12 @@ from myna.application.cubit import CubitApp
 from myna.core.utils import working_directory
 from myna.application.exaca import grain_id_to_reference_id, load_grain_ids
 
+# netCDF4 is an optional dependency, only import it once
+try:
+    from netCDF4 import Dataset
+except ImportError:
+    Dataset = None
+
 
 class CubitVtkToExodusApp(CubitApp):
     """Myna application to convert an ExaCA VTK file with an ID array into an Exodus
@@ -119,13 +125,11 @@ class CubitVtkToExodusApp(CubitApp):
         """Meshes a VTK file containing a structured points array based on the specified
         array name (self.args.field)"""
 
-        try:
-            from netCDF4 import Dataset  # pylint: disable=import-outside-toplevel
-        except ImportError as exc:
+        if Dataset is None:
             raise ImportError(
                 'Myna cubit/vtk_to_exodus_region app requires "pip install .[cubit]"'
                 + "optional dependencies!"
-            ) from exc
+            )
 
         # Pre-process VTK data file
         case_directory = os.path.dirname(exodus_file)
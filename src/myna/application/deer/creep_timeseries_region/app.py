@@ -8,12 +8,20 @@
 #
 """Defines the application behavior for the `deer/creep_timeseries_region` application"""
 
+import json
 import os
+import re
 import subprocess
+from pathlib import Path
 import numpy as np
 import polars as pl
 from myna.application.deer import DeerApp, NetCDF4Dataset
-from myna.core.utils import working_directory
+from myna.core.utils import link_or_copy, working_directory
+
+# Placeholders in the Deer template case input file, substituted in a single pass
+CASE_INPUT_PLACEHOLDER_PATTERN = re.compile(
+    r"\{(LOADDIR|LOAD|RVE_LENGTH|OUTPUT_NAME)\}"
+)
 
 
 class CreepTimeseriesRegionDeerApp(DeerApp):
@@ -45,6 +53,10 @@ class CreepTimeseriesRegionDeerApp(DeerApp):
         self.case_input_file_name = "case.i"
         self.material_model_file_name = "material_model.xml"
         self.output_csv_name = "wCreep_out.csv"
+        self.configured_stamp_name = ".myna_configured"
+
+        # Template case input file contents, read once and shared by all cases
+        self._case_input_template = None
 
     def parse_configure_arguments(self):
         """Check for arguments relevant to the configure step and update app settings"""
@@ -68,9 +80,57 @@ class CreepTimeseriesRegionDeerApp(DeerApp):
         Args:
             case_dir: directory to configure into a valid Deer case
             exodus_file: Exodus mesh file associated with the case"""
-        self.copy_template_to_case(case_dir)
+        stamp_file = os.path.join(case_dir, self.configured_stamp_name)
+        if (not self.args.overwrite) and self.is_case_configured(
+            stamp_file, exodus_file
+        ):
+            print(f"- Skipping already configured case: {case_dir}")
+            return
+        # Template files are hard linked, files updated per case are written as new files
+        self.copy_template_to_case(case_dir, copy_function=link_or_copy)
         self.generate_orientation_file(case_dir, exodus_file)
         self.update_case_loading_parameters(case_dir, exodus_file)
+        with open(stamp_file, "w", encoding="utf-8") as f:
+            json.dump(self.get_configure_stamp(), f)
+
+    def get_configure_stamp(self):
+        """Returns the configure arguments that determine the contents of a case
+
+        Returns:
+            dict: load, loading direction, and template directory of the configure step
+        """
+        return {
+            "load": self.args.load,
+            "loaddir": self.args.loaddir,
+            "template": os.path.abspath(self.template),
+        }
+
+    def is_case_configured(self, stamp_file, exodus_file):
+        """Check if a case was configured with the current configure arguments more
+        recently than its inputs were modified
+
+        Args:
+            stamp_file: path to the stamp file written at the end of `configure_case`
+            exodus_file: Exodus mesh file associated with the case
+
+        Returns:
+            bool: True if the stamp file records the current configure arguments and is
+                newer than the template files and the Exodus mesh file
+        """
+        try:
+            with open(stamp_file, "r", encoding="utf-8") as f:
+                stamp = json.load(f)
+        except (OSError, ValueError):
+            return False
+        if stamp != self.get_configure_stamp():
+            return False
+        input_files = [exodus_file]
+        input_files.extend(x for x in Path(self.template).rglob("*") if x.is_file())
+        try:
+            input_mtime = max(os.path.getmtime(x) for x in input_files)
+        except FileNotFoundError:
+            return False
+        return os.path.getmtime(stamp_file) > input_mtime
 
     def configure(self):
         """Configure all cases for the Myna step"""
@@ -133,6 +193,7 @@ class CreepTimeseriesRegionDeerApp(DeerApp):
                 # Handle serial versus batch submission processes
                 if self.args.batch:
                     processes.append(process)
+                    self.wait_for_open_batch_resources(processes)
                 else:
                     self.wait_for_process_success(process)
 
@@ -183,10 +244,11 @@ class CreepTimeseriesRegionDeerApp(DeerApp):
         Args:
             case_dir: path to the case directory to update"""
 
-        # Get Deer template case file
-        deer_case_input_file = os.path.join(case_dir, self.case_input_file_name)
-        with open(deer_case_input_file, "r", encoding="utf-8") as f:
-            input_file_str = f.read()
+        # Get Deer template case file, which is identical for all cases
+        if self._case_input_template is None:
+            template_file = os.path.join(self.template, self.case_input_file_name)
+            with open(template_file, "r", encoding="utf-8") as f:
+                self._case_input_template = f.read()
 
         # Get mesh dimensions
         mesh_data = NetCDF4Dataset(exodus_mesh_file)
@@ -200,12 +262,20 @@ class CreepTimeseriesRegionDeerApp(DeerApp):
             raise ValueError('loaddir must be "x", "y", or "z"')
 
         # Update string values
-        input_file_str = input_file_str.replace("{LOADDIR}", str(self.args.loaddir))
-        input_file_str = input_file_str.replace("{LOAD}", str(self.args.load))
-        input_file_str = input_file_str.replace("{RVE_LENGTH}", str(rve_length))
-        input_file_str = input_file_str.replace(
-            "{OUTPUT_NAME}", str(self.output_csv_name.replace(".csv", ""))
+        replacements = {
+            "LOADDIR": str(self.args.loaddir),
+            "LOAD": str(self.args.load),
+            "RVE_LENGTH": str(rve_length),
+            "OUTPUT_NAME": str(self.output_csv_name.replace(".csv", "")),
+        }
+        input_file_str = CASE_INPUT_PLACEHOLDER_PATTERN.sub(
+            lambda match: replacements[match.group(1)], self._case_input_template
         )
 
-        with open(deer_case_input_file, "w", encoding="utf-8") as f:
+        # Write to a new file and replace the case file, which may be a hard link to
+        # the template case file
+        deer_case_input_file = os.path.join(case_dir, self.case_input_file_name)
+        tmp_file = deer_case_input_file + ".tmp"
+        with open(tmp_file, "w", encoding="utf-8") as f:
             f.write(input_file_str)
+        os.replace(tmp_file, deer_case_input_file)
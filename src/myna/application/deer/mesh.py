@@ -10,6 +10,12 @@
 
 import numpy as np
 
+# netCDF4 is an optional dependency, only import it once
+try:
+    from netCDF4 import Dataset
+except ImportError:
+    Dataset = None
+
 
 class NetCDF4Dataset:
     """Class to load and calculate NetCDF4 mesh properties relevant to the Deer app.
@@ -24,20 +30,19 @@ class NetCDF4Dataset:
         Args:
             data_file: (str) path to NetCDF data file to load
         """
-        try:
-            from netCDF4 import Dataset  # pylint: disable=import-outside-toplevel
-        except ImportError as exc:
+        if Dataset is None:
             raise ImportError(
                 "Myna deer app requires `pip install .[deer]` optional dependencies!"
-            ) from exc
+            )
 
         self.data_file = data_file
         with Dataset(self.data_file) as mesh:
+            # Read variables as plain arrays, the Exodus block variables are not masked
+            mesh.set_auto_mask(False)
             self.set_dimensions(mesh)
             self.set_n_blocks(mesh)
-            self.set_max_block_number(mesh)
+            self.set_block_numbers(mesh)
             self.set_euler_angles(mesh)
-            self.set_filled_block_numbers(mesh)
 
     def set_dimensions(self, mesh):
         """Calculates the coordinate dimensions of the `netCDF4.Dataset` object and
@@ -70,15 +75,6 @@ class NetCDF4Dataset:
         """
         self.n_blocks = int(mesh.dimensions["num_el_blk"].size)
 
-    def set_max_block_number(self, mesh):
-        """Finds the largest block number in the `netCDF4.Dataset` object
-
-        Args:
-            mesh: `netCDF4.Dataset` object
-        """
-
-        self.max_block_number = int(np.max(mesh.variables["eb_prop1"][:].data))
-
     def set_euler_angles(self, mesh):
         """Extract the Euler angles describing the crystallographic orientation of each
         block to a numpy array
@@ -87,19 +83,29 @@ class NetCDF4Dataset:
             mesh: `netCDF4.Dataset` object
         """
 
-        self.euler_angles = np.zeros((self.n_blocks, 3))
-        self.euler_angles[:, 0] = mesh.variables["euler_bunge_zxz_phi1"][:].data
-        self.euler_angles[:, 1] = mesh.variables["euler_bunge_zxz_Phi"][:].data
-        self.euler_angles[:, 2] = mesh.variables["euler_bunge_zxz_phi2"][:].data
+        # Keep the precision stored in the file, e.g., float32 angles are not upcast
+        angle_variables = [
+            mesh.variables["euler_bunge_zxz_phi1"],
+            mesh.variables["euler_bunge_zxz_Phi"],
+            mesh.variables["euler_bunge_zxz_phi2"],
+        ]
+        dtype = np.result_type(*[x.dtype for x in angle_variables])
+        self.euler_angles = np.zeros((self.n_blocks, 3), dtype=dtype)
+        for i, angle_variable in enumerate(angle_variables):
+            self.euler_angles[:, i] = angle_variable[:]
 
-    def set_filled_block_numbers(self, mesh):
-        """Gets the list of non-empty block indices from the mesh
+    def set_block_numbers(self, mesh):
+        """Reads the block numbers in the `netCDF4.Dataset` object once and sets the
+        largest block number and the list of non-empty block indices
 
         Args:
             mesh: `netCDF4.Dataset` object
         """
-
-        self.filled_block_indices = mesh.variables["eb_prop1"][:].data - 1
+        # Convert to the native index type once, so that scattering into the full
+        # orientation array does not need a temporary index array on each call
+        eb_prop1 = np.asarray(mesh.variables["eb_prop1"][:], dtype=np.intp)
+        self.max_block_number = int(eb_prop1.max())
+        self.filled_block_indices = np.subtract(eb_prop1, 1, out=eb_prop1)
 
     def get_full_orientation_array(self):
         """Generates the full orientation array, including empty blocks
@@ -109,6 +115,8 @@ class NetCDF4Dataset:
                 array describing the Euler angles in Bunge ZXZ notation for all
                 blocks in the mesh, including empty blocks
         """
-        full_orientation_array = np.zeros((self.max_block_number, 3))
-        full_orientation_array[self.filled_block_indices, :] = self.euler_angles
+        full_orientation_array = np.zeros(
+            (self.max_block_number, 3), dtype=self.euler_angles.dtype
+        )
+        full_orientation_array[self.filled_block_indices] = self.euler_angles
         return full_orientation_array
@@ -10,9 +10,11 @@ from .color import add_pyebsd_rgb_color
 from .export import (
     add_rgb_to_vtk,
     extract_subregion,
+    get_pole_locations,
     plot_euler_angles,
     plot_poles,
     plot_pole_density,
+    write_structured_points,
 )
 from .id import (
     rotation_matrix_to_euler,
@@ -22,7 +24,12 @@ from .id import (
 )
 from .subgrain import rotate_grains
 from .meltpool import aggregate_melt_times, merge_melt_times_with_rgb
-from .vtk import grain_id_reader, vtk_structure_points_locs, vtk_unstructured_grid_locs
+from .vtk import (
+    grain_id_reader,
+    vtk_structure_points_axes,
+    vtk_structure_points_locs,
+    vtk_unstructured_grid_locs,
+)
 from .grainstats import (
     get_mean_grain_area,
     get_fract_nucleated_grains,
@@ -37,9 +44,11 @@ __all__ = [
     "add_pyebsd_rgb_color",
     "add_rgb_to_vtk",
     "extract_subregion",
+    "get_pole_locations",
     "plot_euler_angles",
     "plot_poles",
     "plot_pole_density",
+    "write_structured_points",
     "rotation_matrix_to_euler",
     "load_grain_ids",
     "grain_id_to_reference_id",
@@ -48,6 +57,7 @@ __all__ = [
     "aggregate_melt_times",
     "merge_melt_times_with_rgb",
     "grain_id_reader",
+    "vtk_structure_points_axes",
     "vtk_structure_points_locs",
     "vtk_unstructured_grid_locs",
     "get_mean_grain_area",
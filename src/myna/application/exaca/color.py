@@ -52,9 +52,11 @@ def add_pyebsd_rgb_color(df, refDir=[0, 0, 1], suffix=""):
         orientation, pwr=0.4, whitespot=[2, 1, 3]
     )
 
-    # Set grain color
-    df[f"R{suffix}"] = color[:, 0] / 255
-    df[f"G{suffix}"] = color[:, 1] / 255
-    df[f"B{suffix}"] = color[:, 2] / 255
+    # Set grain color, normalized to [0, 1] in single precision
+    rgb = color.astype(np.float32)
+    rgb /= np.float32(255)
+    df[f"R{suffix}"] = rgb[:, 0]
+    df[f"G{suffix}"] = rgb[:, 1]
+    df[f"B{suffix}"] = rgb[:, 2]
 
     return df
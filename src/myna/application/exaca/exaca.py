@@ -6,10 +6,12 @@
 #
 # License: 3-clause BSD, see https://opensource.org/licenses/BSD-3-Clause.
 #
+import copy
 import json
 import os
 import re
 import shutil
+from functools import cache, lru_cache
 
 import numpy as np
 import polars as pl
@@ -19,10 +21,58 @@ from myna.core.utils import nested_set
 from myna.core.workflow.load_input import load_input
 
 
+@lru_cache(maxsize=256)
+def _read_case_inputs(input_file, mtime_ns, size):
+    """Read an ExaCA input file, cached by path, modification time, and size.
+
+    The cached dictionary is shared by all callers, so it is only returned through
+    `load_case_inputs`, which copies it."""
+    with open(input_file, "r", encoding="utf-8") as f:
+        return json.load(f)
+
+
+def load_case_inputs(case_dir):
+    """Load the `inputs.json` file of an ExaCA case directory.
+
+    Parsed inputs are cached until the file is modified, so repeated lookups of the
+    same case (e.g., by the execute and postprocess stages in one process) only parse
+    the file once. Each call returns a deep copy of the cached settings, so the
+    returned dictionary can be modified without affecting other callers.
+
+    Args:
+        case_dir: path to the ExaCA case directory
+
+    Returns:
+        input_settings: dictionary of the ExaCA input settings
+    """
+    input_file = os.path.abspath(os.path.join(case_dir, "inputs.json"))
+    stat = os.stat(input_file)
+    return copy.deepcopy(_read_case_inputs(input_file, stat.st_mtime_ns, stat.st_size))
+
+
+def write_case_inputs(input_file, input_settings):
+    """Write ExaCA input settings to a JSON file with a single write call.
+
+    Args:
+        input_file: path to the ExaCA input file to write
+        input_settings: dictionary of the ExaCA input settings
+    """
+    contents = json.dumps(input_settings, indent=2)
+    with open(input_file, "w", encoding="utf-8") as f:
+        f.write(contents)
+
+
+@cache
+def _placeholder_pattern(placeholders):
+    """Compile a regex matching any of the given literal placeholders."""
+    return re.compile("|".join(re.escape(key) for key in placeholders))
+
+
 class ExaCA(MynaApp):
     def __init__(self):
         super().__init__()
         self.app_type = "exaca"
+        self._executable_path = None
 
     def parse_shared_arguments(self):
         """Setup ExaCA-specific inputs"""
@@ -108,6 +158,7 @@ class ExaCA(MynaApp):
         substrate = input_settings.get("Substrate")
         if substrate is None:
             return input_settings
+        updated = False
         # Direct replacement
         for deprecated, replacement in {
             "MeanSize": "MeanBaseplateGrainSize",
@@ -115,6 +166,7 @@ class ExaCA(MynaApp):
             if deprecated in substrate:
                 substrate.setdefault(replacement, substrate[deprecated])
                 del substrate[deprecated]
+                updated = True
         # Derived replacement: density -> size
         for deprecated, replacement in {
             "PowderDensity": "MeanPowderGrainSize",
@@ -124,9 +176,11 @@ class ExaCA(MynaApp):
                     replacement, 1 / np.power(substrate[deprecated], 1 / 3)
                 )
                 del substrate[deprecated]
+                updated = True
 
-        with open(os.path.join(case_dir, "inputs.json"), "w", encoding="utf-8") as f:
-            json.dump(input_settings, f, indent=2)
+        # Only rewrite the input file if a deprecated setting was replaced
+        if updated:
+            write_case_inputs(os.path.join(case_dir, "inputs.json"), input_settings)
         return input_settings
 
     def _get_material_file(self, myna_settings):
@@ -136,13 +190,26 @@ class ExaCA(MynaApp):
             os.environ["MYNA_APP_PATH"], "exaca", "materials", f"{material}.json"
         )
 
-    def _get_orientation_file(self):
-        """Resolve the grain orientation reference file from the ExaCA install."""
+    def _get_executable_path(self):
+        """Resolve the full path of the ExaCA executable.
+
+        The `$PATH` lookup is cached for the current `--exec` value, so that it is only
+        done once when configuring many cases."""
+        if self._executable_path is not None:
+            exec_arg, exaca_exec = self._executable_path
+            if exec_arg == self.args.exec:
+                return exaca_exec
         exaca_exec = shutil.which(self.args.exec)
         if exaca_exec is None:
             raise FileNotFoundError(
                 f'{self.name} app executable "{self.args.exec}" was not found.'
             )
+        self._executable_path = (self.args.exec, exaca_exec)
+        return exaca_exec
+
+    def _get_orientation_file(self):
+        """Resolve the grain orientation reference file from the ExaCA install."""
+        exaca_exec = self._get_executable_path()
         exaca_install_dir = os.path.dirname(os.path.dirname(exaca_exec))
         return os.path.join(
             exaca_install_dir, "share", "ExaCA", "GrainOrientationVectors.csv"
@@ -206,24 +273,22 @@ class ExaCA(MynaApp):
         return sanitized_files
 
     def _replace_run_script_placeholders(self, run_script, replacements):
-        """Replace template placeholders in a case run script."""
+        """Replace template placeholders in a case run script in a single pass over
+        the file contents, only rewriting the file if a placeholder was found."""
+        if not replacements:
+            return
         with open(run_script, "r", encoding="utf-8") as f:
-            lines = f.readlines()
-        for i, line in enumerate(lines):
-            for placeholder, value in replacements.items():
-                line = line.replace(placeholder, value)
-            lines[i] = line
-        with open(run_script, "w", encoding="utf-8") as f:
-            f.writelines(lines)
+            contents = f.read()
+        pattern = _placeholder_pattern(tuple(replacements))
+        new_contents = pattern.sub(lambda match: replacements[match.group(0)], contents)
+        if new_contents != contents:
+            with open(run_script, "w", encoding="utf-8") as f:
+                f.write(new_contents)
 
     def _patch_case_executable(self, case_dir):
         """Write the resolved ExaCA executable location into a case script."""
         run_script = os.path.join(case_dir, "runCase.sh")
-        exaca_exec = shutil.which(self.args.exec)
-        if exaca_exec is None:
-            raise FileNotFoundError(
-                f'{self.name} app executable "{self.args.exec}" was not found.'
-            )
+        exaca_exec = self._get_executable_path()
         self._replace_run_script_placeholders(
             run_script,
             {
@@ -252,8 +317,7 @@ class ExaCA(MynaApp):
         input_settings = self._update_input_settings(
             input_settings, solid_files, layer_thickness, myna_settings
         )
-        with open(input_file, "w", encoding="utf-8") as f:
-            json.dump(input_settings, f, indent=2)
+        write_case_inputs(input_file, input_settings)
 
         self._patch_case_executable(case_dir)
         return input_settings
@@ -6,8 +6,9 @@
 #
 # License: 3-clause BSD, see https://opensource.org/licenses/BSD-3-Clause.
 #
+import itertools
 import vtk
-from vtk.util.numpy_support import numpy_to_vtk
+from vtk.util.numpy_support import numpy_to_vtk, vtk_to_numpy
 from .color import add_pyebsd_rgb_color
 from .id import convert_id_to_rotation
 from .vtk import grain_id_reader
@@ -16,6 +17,30 @@ import matplotlib.pyplot as plt
 from scipy.ndimage import gaussian_filter
 
 
+def write_structured_points(vtk_dataset, vtk_export_path):
+    """Write a structured points dataset to a VTK file
+
+    Files with the ".vti" extension are written in the VTK XML image data format with
+    zlib-compressed, raw appended data. All other files are written in the binary
+    legacy VTK format, which is the format read by `grain_id_reader`.
+
+    Args:
+        vtk_dataset: vtkStructuredPoints (or vtkImageData) object to write
+        vtk_export_path: path for export of the VTK file
+    """
+    if str(vtk_export_path).lower().endswith(".vti"):
+        writer = vtk.vtkXMLImageDataWriter()
+        writer.SetDataModeToAppended()
+        writer.SetEncodeAppendedData(False)
+        writer.SetCompressorTypeToZLib()
+    else:
+        writer = vtk.vtkDataSetWriter()
+        writer.SetFileTypeToBinary()
+    writer.SetFileName(str(vtk_export_path))
+    writer.SetInputData(vtk_dataset)
+    writer.Write()
+
+
 def add_rgb_to_vtk(
     vtk_file_path,
     vtk_export_path,
@@ -26,7 +51,8 @@ def add_rgb_to_vtk(
 
     Args:
         vtk_file_path: path to VTK file to add RGB colors to
-        vtk_export_path: path for export of modified VTK file
+        vtk_export_path: path for export of modified VTK file, see
+            `write_structured_points` for the supported formats
         lookup_name: path to the lookup table of Reference ID orientations (e.g., GrainOrientationVectors.csv)
     """
 
@@ -40,8 +66,8 @@ def add_rgb_to_vtk(
     # Convert grain ids into Euler angles
     df = convert_id_to_rotation(reader, lookup_name)
 
-    # Add colors to the DataFrame
-    df = df.sort_values(by=["Z (m)", "Y (m)", "X (m)"])
+    # Add colors to the DataFrame. Rows are already in the VTK point order (X fastest,
+    # then Y, then Z), so no sorting is needed before writing the arrays
     suffices = dirs.keys()
     directions = [dirs[key] for key in suffices]
     for suffix, dir in zip(suffices, directions):
@@ -53,11 +79,15 @@ def add_rgb_to_vtk(
     vtk_dataset.SetSpacing(spacing)
     vtk_dataset.SetOrigin(origin)
 
-    # Add scalar data to vtk_dataset from dataframe
+    # Add scalar data to vtk_dataset from dataframe. VTK arrays share the buffers of
+    # the NumPy arrays, which are kept in `vtk_buffers` until the file is written
+    vtk_buffers = []
     scalar_names = ["Grain ID", "Reference ID"]
     scalar_types = [vtk.VTK_INT, vtk.VTK_INT]
     for col, val_type in zip(scalar_names, scalar_types):
-        vtk_data = numpy_to_vtk(num_array=df[col].to_numpy(), array_type=val_type)
+        values = np.ascontiguousarray(df[col].to_numpy(), dtype=np.intc)
+        vtk_buffers.append(values)
+        vtk_data = numpy_to_vtk(num_array=values, deep=False, array_type=val_type)
         vtk_data.SetName(col)
         vtk_dataset.GetPointData().AddArray(vtk_data)
 
@@ -65,19 +95,17 @@ def add_rgb_to_vtk(
     # <"RX", "GX", "BX">, <"RY", "GY", "BY">, <"RZ", "GZ", "BZ">
     for suffix in suffices:
         cols = [f"R{suffix}", f"G{suffix}", f"B{suffix}"]
-        # Add data as vector to VTK dataset
-        vtk_data = numpy_to_vtk(
-            num_array=df[cols].to_numpy(), deep=True, array_type=vtk.VTK_FLOAT
-        )
+        # Pack the columns into one interleaved float32 buffer shared with VTK
+        rgb = np.empty((len(df), 3), dtype=np.float32, order="C")
+        for i, col in enumerate(cols):
+            rgb[:, i] = df[col].to_numpy(copy=False)
+        vtk_buffers.append(rgb)
+        vtk_data = numpy_to_vtk(num_array=rgb, deep=False, array_type=vtk.VTK_FLOAT)
         vtk_data.SetName(f"rgb{suffix}")
         vtk_dataset.GetPointData().AddArray(vtk_data)
 
     # Write file using VTK file writer
-    writer = vtk.vtkDataSetWriter()
-    writer.SetFileName(vtk_export_path)
-    writer.SetInputData(vtk_dataset)
-    writer.SetFileTypeToBinary()
-    writer.Write()
+    write_structured_points(vtk_dataset, vtk_export_path)
 
     return
 
@@ -89,7 +117,8 @@ def extract_subregion(
 
     Args:
         vtk_file_path: path to VTK file to to extract region from
-        vtk_export_path: path for export of modified VTK file
+        vtk_export_path: path for export of modified VTK file, see
+            `write_structured_points` for the supported formats
         bounds: array of X, Y, and Z min & max bounds in terms of fraction of the overall volume dimensions
     """
 
@@ -111,19 +140,41 @@ def extract_subregion(
     z0 = np.clip(int(bounds[2][0] * dims[2]), 0, dims[2] - 1)
     z1 = np.clip(int(bounds[2][1] * dims[2]), 0, dims[2] - 1)
 
-    # Extract the subvolume
-    extractor = vtk.vtkExtractVOI()
-    extractor.SetInputData(structured_points)
-    extractor.SetVOI(x0, x1, y0, y1, z0, z1)
-    extractor.Update()
-    subvolume = extractor.GetOutput()
+    # Initialize the subvolume, with the origin shifted to the first extracted point
+    origin = structured_points.GetOrigin()
+    spacing = structured_points.GetSpacing()
+    subvolume = vtk.vtkStructuredPoints()
+    subvolume.SetDimensions(x1 - x0 + 1, y1 - y0 + 1, z1 - z0 + 1)
+    subvolume.SetSpacing(spacing)
+    subvolume.SetOrigin(
+        origin[0] + x0 * spacing[0],
+        origin[1] + y0 * spacing[1],
+        origin[2] + z0 * spacing[2],
+    )
+
+    # Extract the subvolume of each point data array by slicing a (Z, Y, X) view
+    point_data = structured_points.GetPointData()
+    for i in range(point_data.GetNumberOfArrays()):
+        array = point_data.GetArray(i)
+        if array is None:
+            continue
+        n_components = array.GetNumberOfComponents()
+        values = vtk_to_numpy(array).reshape(dims[2], dims[1], dims[0], n_components)
+        values = values[z0 : z1 + 1, y0 : y1 + 1, x0 : x1 + 1].reshape(-1, n_components)
+        if n_components == 1:
+            values = values[:, 0]
+        sub_array = numpy_to_vtk(
+            np.ascontiguousarray(values), deep=True, array_type=array.GetDataType()
+        )
+        sub_array.SetName(array.GetName())
+        attribute_type = point_data.IsArrayAnAttribute(i)
+        if attribute_type >= 0:
+            subvolume.GetPointData().SetAttribute(sub_array, attribute_type)
+        else:
+            subvolume.GetPointData().AddArray(sub_array)
 
     # Write file using VTK file writer
-    writer = vtk.vtkDataSetWriter()
-    writer.SetFileName(vtk_export_path)
-    writer.SetInputData(subvolume)
-    writer.SetFileTypeToBinary()
-    writer.Write()
+    write_structured_points(subvolume, vtk_export_path)
 
     return
 
@@ -193,6 +244,54 @@ def plot_poles(M, direction, ax=None):
     return ax
 
 
+def _get_cubic_symmetry_operators():
+    """Get the 24 proper rotations of the cubic point group
+
+    Returns:
+      C: numpy array (24,3,3,) of the signed permutation matrices with determinant +1
+    """
+    operators = []
+    for perm in itertools.permutations(range(3)):
+        for signs in itertools.product([1, -1], repeat=3):
+            op = np.zeros((3, 3))
+            op[range(3), perm] = signs
+            if np.linalg.det(op) > 0:
+                operators.append(op)
+    return np.array(operators)
+
+
+def get_pole_locations(M, direction):
+    """Calculate the stereographic projection of the poles of the cubic family of
+    the given direction for all N rotation matrices
+
+    Poles in the lower hemisphere are inverted to the upper hemisphere before the
+    stereographic projection `X = x / (1 + z)`, `Y = y / (1 + z)`.
+
+    Args:
+      M: array-like (N,3,3,) of rotation matrices for sample -> crystal coordinates (passive reference frame)
+      direction: array-like (3,) describing the normal for the spherical projection
+
+    Returns:
+      pole_data: numpy array of XY locations of the calculated poles such that
+        `X=pole_data[:,0]` and `Y=pole_data[:,1]`.
+    """
+    # Unique crystal directions in the family of the given direction
+    direction = np.asarray(direction, dtype=np.float64)
+    direction = direction / np.linalg.norm(direction)
+    family = _get_cubic_symmetry_operators() @ direction
+    _, unique_ids = np.unique(family.round(8), axis=0, return_index=True)
+    family = family[np.sort(unique_ids)]
+
+    # Crystal directions in the sample frame, inverted to the upper hemisphere
+    xyz = np.einsum("nji,kj->nki", np.asarray(M, dtype=np.float64), family)
+    xyz = xyz.reshape(-1, 3)
+    xyz[xyz[:, 2] < 0] *= -1
+
+    # Stereographic projection
+    pole_data = xyz[:, :2] / (1.0 + xyz[:, 2:])
+    return pole_data
+
+
 def plot_pole_density(
     M,
     direction,
@@ -226,43 +325,29 @@ def plot_pole_density(
     Returns:
       ax: axis with the pole figure
     """
-    try:
-        from pyebsd.ebsd import plot_PF
-    except ImportError as exc:
-        raise ImportError(
-            'Myna exaca app requires "pip install .[exaca]" optional dependencies!'
-        ) from exc
-
     # Get pole locations
-    fig_temp, ax_temp = plt.subplots()
-    ax_temp = plot_PF(
-        M=M,
-        proj=direction,
-        ax=ax_temp,
-        sel=None,
-        rotation=None,
-        contour=False,
-        verbose=True,
-    )
-    pole_data = np.array(ax_temp.lines[0].get_xydata())
-    plt.close(fig_temp)
+    pole_data = get_pole_locations(M, direction)
 
-    # Calculate histogram and get mesh centroids
+    # Calculate histogram on equally spaced bins over [-1, 1] by counting the flat
+    # (row-major, Y then X) bin index of each pole
     if bins is None:
         bins = int(np.sqrt(M.shape[0]))
-    hist, xedges, yedges = np.histogram2d(
-        pole_data[:, 1], pole_data[:, 0], bins=bins, range=[[-1, 1], [-1, 1]]
-    )
-
-    # Adjust hist to multiples of random distribution
+    edges = np.linspace(-1, 1, bins + 1)
+    bin_ids = ((pole_data + 1.0) * (bins / 2)).astype(np.intp)
+    np.clip(bin_ids, 0, bins - 1, out=bin_ids)
+    flat_ids = bin_ids[:, 1] * bins + bin_ids[:, 0]
+    hist = np.bincount(flat_ids, minlength=bins * bins).astype(np.float64)
+    hist = hist.reshape(bins, bins)
+
+    # Adjust hist in place to multiples of random distribution
     if use_multiples_of_random:
         random_point_density = np.sum(hist) / (np.pi * np.power(1, 2))
-        hist_element_area = (xedges[1] - xedges[0]) * (yedges[1] - yedges[0])
-        hist = hist / (random_point_density * hist_element_area)
+        hist_element_area = (edges[1] - edges[0]) ** 2
+        np.multiply(hist, 1.0 / (random_point_density * hist_element_area), out=hist)
 
-    # Smooth histogram using a Gaussian filter
+    # Smooth histogram in place using a Gaussian filter
     if smooth_sigma is not None:
-        hist = gaussian_filter(hist, smooth_sigma)
+        gaussian_filter(hist, smooth_sigma, output=hist)
 
     # Set contour levels
     if isinstance(levels, int):
@@ -294,14 +379,11 @@ def plot_pole_density(
         extend="both",
     )
 
-    # Create mask
+    # Create mask outside of the unit circle, with the scalar bounds broadcast
     xs = np.linspace(-1, 1, 1000)
-    y0 = -np.ones_like(xs)
-    y1 = np.ones_like(xs)
-    yc_upper = np.where(xs <= 1, np.sqrt(1 - np.power(xs, 2)), 0)
-    yc_lower = -yc_upper
-    plt.fill_between(xs, y0, yc_lower, fc="w", ec="w")
-    plt.fill_between(xs, yc_upper, y1, fc="w", ec="w")
+    yc = np.sqrt(np.clip(1 - xs * xs, 0, None))
+    ax.fill_between(xs, -1, -yc, fc="w", ec="w")
+    ax.fill_between(xs, yc, 1, fc="w", ec="w")
 
     # Add border and format axes
     circle = plt.Circle((0.0, 0.0), 1.0, fc="none", ec="k", linewidth=3)
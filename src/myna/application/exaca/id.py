@@ -45,22 +45,23 @@ def rotation_matrix_to_euler(R, frame="passive"):
     g32 = R[:, 2, 1]
     g33 = R[:, 2, 2]
     Phi = np.arccos(g33)
-    phi1 = np.where(
-        np.sin(Phi) != 0,
-        np.arctan2(g31, -g32),
-        np.where(
-            Phi == 0,
-            np.arctan2(-g21, g11) - const,
-            np.arctan2(g21, g11) + const,
-        ),
-    )
-    phi2 = np.where(
-        np.sin(Phi) != 0,
-        np.arctan2(g13, g23),
-        np.ones_like(Phi) * const,
+
+    # Only evaluate the degenerate branches for the points where np.sin(Phi) == 0
+    nondegenerate = np.sin(Phi) != 0
+    degenerate = ~nondegenerate
+    phi1 = np.empty_like(Phi)
+    phi1[nondegenerate] = np.arctan2(g31[nondegenerate], -g32[nondegenerate])
+    phi1[degenerate] = np.where(
+        Phi[degenerate] == 0,
+        np.arctan2(-g21[degenerate], g11[degenerate]) - const,
+        np.arctan2(g21[degenerate], g11[degenerate]) + const,
     )
-    phi1[phi1 < 0] = phi1[phi1 < 0] + 2.0 * np.pi
-    phi2[phi2 < 0] = phi2[phi2 < 0] + 2.0 * np.pi
+    phi2 = np.full_like(Phi, const)
+    phi2[nondegenerate] = np.arctan2(g13[nondegenerate], g23[nondegenerate])
+
+    # Wrap angles to [0, 2*pi)
+    phi1 = np.mod(phi1, 2.0 * np.pi)
+    phi2 = np.mod(phi2, 2.0 * np.pi)
     return phi1, Phi, phi2
 
 
@@ -112,52 +113,81 @@ def grain_id_to_reference_id(grain_ids, num_ref_ids):
 
 # Convert Grain IDs to orientation vectors using a list of reference IDs
 def convert_id_to_rotation(
-    vtk_reader, ref_id_file, misorientation=0.0, update_ids=False
+    vtk_reader, ref_id_file, misorientation=0.0, update_ids=False, z_index=None
 ):
+    """Converts the grain IDs of an ExaCA VTK file to Euler angles
+
+    Args:
+        vtk_reader: VTK reader for the ExaCA grain ID file
+        ref_id_file: path to the reference orientation file
+        misorientation: (float) misorientation rate to apply to each grain
+        update_ids: (bool) whether to update the reference IDs of rotated grains
+        z_index: (optional int) index of a single Z-plane of points to convert,
+            defaults to all points
+
+    Returns:
+        dfMerged: pandas DataFrame with a row for each point, in the VTK point order
+            (X varies fastest, then Y, then Z)
+    """
     # Get dataframe of reference ids
     df_ids = load_grain_ids(ref_id_file)
 
     # Get the output of the reader
     structured_points = vtk_reader.GetStructuredPointsOutput()
 
-    # Get the coordinates of all points
-    x, y, z = vtk_structure_points_locs(structured_points)
+    # Get the coordinates of all points (or of the requested Z-plane)
+    x, y, z = vtk_structure_points_locs(structured_points, z_index=z_index)
 
-    # Convert vtk data to dataframe
+    # Get grain IDs and the corresponding orientation IDs. The points of a Z-plane
+    # are a contiguous block of the VTK point order, so only that block is converted
     gids = vtk_to_numpy(structured_points.GetPointData().GetArray("GrainID"))
-    data = pd.DataFrame({"X (m)": x, "Y (m)": y, "Z (m)": z})
-
-    # ID for orientation
-    data["Reference ID"] = grain_id_to_reference_id(gids, len(df_ids))
-    data["Reference ID"] = data["Reference ID"].astype(int)
-
-    # ID for parent grain
-    data["Grain ID"] = gids
-    data["Grain ID"] = data["Grain ID"].astype(int)
-
-    # Merge VTK and Reference ID DataFrames
-    dfMerged = data.merge(df_ids, on="Reference ID", how="outer")
-    dfMerged.drop(dfMerged.index[dfMerged["Grain ID"].isna()], inplace=True)
-
-    # Set new axes
-    dfMerged["axis_dist"] = 0
-    dfMerged["theta"] = 0
-
-    # Save reference orientations
+    if z_index is not None:
+        dims = structured_points.GetDimensions()
+        plane_size = dims[0] * dims[1]
+        gids = gids[z_index * plane_size : (z_index + 1) * plane_size]
+    ref_ids = grain_id_to_reference_id(gids, len(df_ids))
+
+    # Save reference orientations in single precision, which is sufficient for the
+    # RGB coloring and halves the memory of the per-point Euler angle columns
     ref_cols = ["phi1", "Phi", "phi2"]
-    ref_cols_ids = [dfMerged.columns.get_loc(x) for x in ref_cols]
-    ref_or = df_ids[ref_cols].to_numpy()
-    ref_id = df_ids["Reference ID"].to_numpy()
+    ref_or = df_ids[ref_cols].to_numpy(dtype=np.float32)
+
+    # Look up the orientation of each point from its Reference ID, which is also the
+    # row index of the reference orientation in `df_ids`
+    ref_or_points = ref_or[ref_ids]
+
+    # Construct the dataframe from all columns at once, using 32-bit types for the
+    # ID, Euler angle, and rotation columns
+    num_points = len(gids)
+    dfMerged = pd.DataFrame(
+        {
+            "X (m)": x,
+            "Y (m)": y,
+            "Z (m)": z,
+            "Reference ID": ref_ids.astype(np.int32, copy=False),
+            "Grain ID": gids.astype(np.int32, copy=False),
+            "phi1": ref_or_points[:, 0],
+            "Phi": ref_or_points[:, 1],
+            "phi2": ref_or_points[:, 2],
+            "axis_dist": np.zeros(num_points, dtype=np.float32),
+            "theta": np.zeros(num_points, dtype=np.float32),
+        },
+        copy=False,
+    )
+
+    # Without a misorientation, none of the grain rotation bookkeeping is needed
+    if misorientation == 0.0:
+        return dfMerged
 
     # Sort list of grains by size
-    group = dfMerged.groupby("Grain ID")
-    sorted_group = sorted(zip(group.size(), group.grouper.levels[0]), reverse=True)
-    gids = [x[1] for x in sorted_group]
+    ref_id = df_ids["Reference ID"].to_numpy()
+    col_index = {col: i for i, col in enumerate(dfMerged.columns)}
+    ref_cols_ids = [col_index[col] for col in ref_cols]
+    gids = dfMerged["Grain ID"].value_counts(sort=True).index.to_numpy()
 
     # Calculate rotated grain orientation vectors
-    if misorientation != 0.0:
-        dfMerged = rotate_grains(
-            dfMerged, gids, misorientation, update_ids, ref_or, ref_id, ref_cols_ids
-        )
+    dfMerged = rotate_grains(
+        dfMerged, gids, misorientation, update_ids, ref_or, ref_id, ref_cols_ids
+    )
 
     return dfMerged
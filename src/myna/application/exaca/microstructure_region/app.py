@@ -9,9 +9,11 @@
 import json
 import os
 import shutil
+from concurrent.futures import ProcessPoolExecutor
 import polars as pl
 from myna.core.utils import nested_get, nested_set
 from myna.application.exaca import ExaCA, add_rgb_to_vtk
+from myna.application.exaca.exaca import load_case_inputs
 
 
 class ExaCAMicrostructureRegion(ExaCA):
@@ -33,14 +35,26 @@ class ExaCAMicrostructureRegion(ExaCA):
         with open(analysis_file, "r", encoding="utf-8") as f:
             analysis_settings = json.load(f)
 
-        df = pl.read_csv(
+        # Only the X and Y bounds of the temperature data are needed, so let Polars
+        # project and aggregate the columns while scanning the file
+        lf = pl.scan_csv(
             nested_get(input_settings, ["TemperatureData", "TemperatureFiles"])[0]
         )
-        if df.is_empty():
+        bounds = (
+            self._normalize_temperature_columns(lf)
+            .select(
+                pl.len().alias("n"),
+                pl.col("x").min().alias("xmin"),
+                pl.col("x").max().alias("xmax"),
+                pl.col("y").min().alias("ymin"),
+                pl.col("y").max().alias("ymax"),
+            )
+            .collect()
+        )
+        if bounds["n"][0] == 0:
             return
-        df = self._normalize_temperature_columns(df)
-        xmin, xmax = [df["x"].min(), df["x"].max()]
-        ymin, ymax = [df["y"].min(), df["y"].max()]
+        xmin, xmax = [bounds["xmin"][0], bounds["xmax"][0]]
+        ymin, ymax = [bounds["ymin"][0], bounds["ymax"][0]]
         spacing = nested_get(input_settings, ["Domain", "CellSize"])
         dx = (xmax - xmin) * 1e6 / spacing
         dy = (ymax - ymin) * 1e6 / spacing
@@ -66,17 +80,21 @@ class ExaCAMicrostructureRegion(ExaCA):
             json.dump(analysis_settings, f, indent=2)
 
     def _normalize_temperature_columns(self, df):
-        """Support both legacy bare coordinates and unit-bearing Myna CSV headers."""
+        """Support both legacy bare coordinates and unit-bearing Myna CSV headers.
+
+        Accepts either a Polars DataFrame or LazyFrame and returns the same type."""
+        columns = df.collect_schema().names()
         rename_map = {}
         for axis in ("x", "y", "z"):
-            if axis in df.columns:
+            if axis in columns:
                 continue
             unit_name = f"{axis} (m)"
-            if unit_name in df.columns:
+            if unit_name in columns:
                 rename_map[unit_name] = axis
         if rename_map:
             df = df.rename(rename_map)
-        cast_columns = [axis for axis in ("x", "y", "z") if axis in df.columns]
+            columns = [rename_map.get(x, x) for x in columns]
+        cast_columns = [axis for axis in ("x", "y", "z") if axis in columns]
         if cast_columns:
             df = df.with_columns(
                 [
@@ -131,8 +149,8 @@ class ExaCAMicrostructureRegion(ExaCA):
         self._patch_case_ranks(case_dir)
         run_script = os.path.join(case_dir, "runCase.sh")
 
-        chmod_process = self.start_subprocess(["chmod", "755", run_script])
-        self.wait_for_process_success(chmod_process)
+        # Set the script permissions directly instead of launching a `chmod` process
+        os.chmod(run_script, 0o755)
         process = self.start_subprocess([run_script])
         result_file = os.path.join(case_dir, "exaca.vtk")
         return result_file, process
@@ -141,6 +159,11 @@ class ExaCAMicrostructureRegion(ExaCA):
         """Promote the raw ExaCA VTK to the workflow output path."""
         shutil.move(filepath, myna_file)
 
+    def _finalize_case_outputs(self, case_outputs):
+        """Finalize each `(filepath, myna_file)` pair of the executed cases."""
+        for filepath, myna_file in case_outputs:
+            self._finalize_case_output(filepath, myna_file)
+
     def execute(self):
         """Execute all ExaCA microstructure_region cases."""
         self.parse_execute_arguments()
@@ -164,11 +187,28 @@ class ExaCAMicrostructureRegion(ExaCA):
         if self.args.batch:
             self.wait_for_all_process_success(processes)
 
-        for filepath, mynafile, file_is_valid in zip(
-            output_files, myna_files, files_are_valid
-        ):
-            if not file_is_valid and os.path.exists(filepath):
-                self._finalize_case_output(filepath, mynafile)
+        self._finalize_case_outputs(
+            [
+                (filepath, mynafile)
+                for filepath, mynafile, file_is_valid in zip(
+                    output_files, myna_files, files_are_valid
+                )
+                if not file_is_valid and os.path.exists(filepath)
+            ]
+        )
+
+    def _export_rgb_vtks(self, rgb_tasks):
+        """Run `add_rgb_to_vtk` for each `(vtk_file, export_file, ref_file)` task.
+
+        The cases are independent, so in batch mode they are distributed across a pool
+        of up to `self.args.maxproc` worker processes."""
+        if self.args.batch and len(rgb_tasks) > 1:
+            max_workers = min(self.args.maxproc or os.cpu_count() or 1, len(rgb_tasks))
+            with ProcessPoolExecutor(max_workers=max_workers) as executor:
+                list(executor.map(add_rgb_to_vtk, *zip(*rgb_tasks)))
+        else:
+            for vtk_file, export_file, ref_file in rgb_tasks:
+                add_rgb_to_vtk(vtk_file, export_file, ref_file)
 
     def postprocess(self):
         """Export RGB-colored VTKs for valid ExaCA outputs."""
@@ -176,13 +216,13 @@ class ExaCAMicrostructureRegion(ExaCA):
         myna_files = self.get_step_output_paths()
         _, _, files_are_valid = self.get_output_file_status()
 
+        rgb_tasks = []
         for myna_file, valid in zip(myna_files, files_are_valid):
             if not valid:
                 continue
-            input_file = os.path.join(os.path.dirname(myna_file), "inputs.json")
-            with open(input_file, "r", encoding="utf-8") as f:
-                input_dict = json.load(f)
+            input_dict = load_case_inputs(os.path.dirname(myna_file))
             ref_file = input_dict["GrainOrientationFile"]
 
             export_file = myna_file.replace(".vtk", "_rgb.vtk")
-            add_rgb_to_vtk(myna_file, export_file, ref_file)
+            rgb_tasks.append((myna_file, export_file, ref_file))
+        self._export_rgb_vtks(rgb_tasks)
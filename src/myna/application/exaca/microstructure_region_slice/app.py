@@ -6,22 +6,69 @@
 #
 # License: 3-clause BSD, see https://opensource.org/licenses/BSD-3-Clause.
 #
-import json
 import os
+from concurrent.futures import ProcessPoolExecutor
 import numpy as np
-import pandas as pd
+import polars as pl
 from myna.core.utils import nested_get
 from myna.application.exaca import (
-    add_rgb_to_vtk,
     convert_id_to_rotation,
     get_fract_nucleated_grains,
     get_mean_grain_area,
     get_wasserstein_distance_misorientation_z,
     grain_id_reader,
+    vtk_structure_points_axes,
 )
+from myna.application.exaca.exaca import load_case_inputs
 from myna.application.exaca.microstructure_region import ExaCAMicrostructureRegion
 
 
+def write_slice_statistics(filepath, myna_file):
+    """Convert the raw ExaCA VTK into slice statistics CSV output.
+
+    Args:
+        filepath: path to the raw ExaCA VTK output of the case
+        myna_file: path to the slice statistics CSV to write
+    """
+    input_dict = load_case_inputs(os.path.dirname(myna_file))
+    ref_file = input_dict["GrainOrientationFile"]
+
+    reader = grain_id_reader(filepath)
+    structured_points = reader.GetOutput()
+    spacing = structured_points.GetSpacing()
+
+    # Select the Z-slice nearest the middle of the Z bounds from the Z-coordinates of
+    # the grid, and only convert the grain IDs of the points in that slice
+    zlist = vtk_structure_points_axes(structured_points)[2]
+    slice_z_loc = 0.5 * (zlist.max() + zlist.min())
+    slice_z_index = int(np.argmin(np.abs(zlist - slice_z_loc)))
+    df = convert_id_to_rotation(reader, ref_file, z_index=slice_z_index)
+
+    mean_grain_area = get_mean_grain_area(df, spacing[0])
+    fraction_nucleated_grains = get_fract_nucleated_grains(df)
+    wasserstein_z = get_wasserstein_distance_misorientation_z(df, ref_file)
+
+    # Write the statistics with Polars, which formats the CSV in native code
+    num_points = len(df)
+    df_stats = pl.DataFrame(
+        {
+            "X (m)": df["X (m)"].to_numpy(),
+            "Y (m)": df["Y (m)"].to_numpy(),
+            "Z (m)": df["Z (m)"].to_numpy(),
+            "Mean Grain Area (m^2)": np.full(
+                num_points, mean_grain_area, dtype=np.float64
+            ),
+            "Nulceated Fraction": np.full(
+                num_points, fraction_nucleated_grains, dtype=np.float64
+            ),
+            "Wasserstein distance (100-Z)": np.full(
+                num_points, wasserstein_z, dtype=np.float64
+            ),
+        }
+    )
+    df_stats.write_csv(myna_file)
+
+
 class ExaCAMicrostructureRegionSlice(ExaCAMicrostructureRegion):
     def __init__(self):
         super().__init__()
@@ -35,39 +82,28 @@ class ExaCAMicrostructureRegionSlice(ExaCAMicrostructureRegion):
 
     def _finalize_case_output(self, filepath, myna_file):
         """Convert the raw ExaCA VTK into slice statistics CSV output."""
-        input_file = os.path.join(os.path.dirname(myna_file), "inputs.json")
-        with open(input_file, "r", encoding="utf-8") as f:
-            input_dict = json.load(f)
-        ref_file = input_dict["GrainOrientationFile"]
-
-        reader = grain_id_reader(filepath)
-        structured_points = reader.GetOutput()
-        spacing = structured_points.GetSpacing()
-
-        df = convert_id_to_rotation(reader, ref_file)
-        zlist = df["Z (m)"].unique()
-        slice_z_loc = 0.5 * (df["Z (m)"].max() + df["Z (m)"].min())
-        slice_z_loc = zlist[np.argmin(np.abs(zlist - slice_z_loc))]
-        df = df[df["Z (m)"] == slice_z_loc]
-
-        mean_grain_area = get_mean_grain_area(df, spacing[0])
-        fraction_nucleated_grains = get_fract_nucleated_grains(df)
-        wasserstein_z = get_wasserstein_distance_misorientation_z(df, ref_file)
-
-        df_stats = pd.DataFrame(
-            {
-                "X (m)": df["X (m)"].to_numpy(),
-                "Y (m)": df["Y (m)"].to_numpy(),
-                "Z (m)": df["Z (m)"].to_numpy(),
-                "Mean Grain Area (m^2)": np.ones_like(df["X (m)"].to_numpy())
-                * mean_grain_area,
-                "Nulceated Fraction": np.ones_like(df["X (m)"].to_numpy())
-                * fraction_nucleated_grains,
-                "Wasserstein distance (100-Z)": np.ones_like(df["X (m)"].to_numpy())
-                * wasserstein_z,
-            }
-        )
-        df_stats.to_csv(myna_file, index=False)
+        write_slice_statistics(filepath, myna_file)
+
+    def _finalize_case_outputs(self, case_outputs):
+        """Write the slice statistics of each `(filepath, myna_file)` pair.
+
+        The cases are independent, so in batch mode they are distributed across a pool
+        of up to `self.args.maxproc` worker processes. The cases are only finalized
+        after all ExaCA processes have exited, so the workers do not compete with
+        running cases for processors and memory."""
+        if self.args.batch and len(case_outputs) > 1:
+            max_workers = min(
+                self.args.maxproc or os.cpu_count() or 1, len(case_outputs)
+            )
+            with ProcessPoolExecutor(max_workers=max_workers) as executor:
+                futures = [
+                    executor.submit(write_slice_statistics, filepath, myna_file)
+                    for filepath, myna_file in case_outputs
+                ]
+                for future in futures:
+                    future.result()
+        else:
+            super()._finalize_case_outputs(case_outputs)
 
     def postprocess(self):
         """Export RGB-colored VTKs for the slice cases."""
@@ -75,13 +111,12 @@ class ExaCAMicrostructureRegionSlice(ExaCAMicrostructureRegion):
         myna_files = self.get_step_output_paths()
         _, _, files_are_valid = self.get_output_file_status()
 
+        rgb_tasks = []
         for myna_file, valid in zip(myna_files, files_are_valid):
             if not valid:
                 continue
 
-            input_file = os.path.join(os.path.dirname(myna_file), "inputs.json")
-            with open(input_file, "r", encoding="utf-8") as f:
-                input_dict = json.load(f)
+            input_dict = load_case_inputs(os.path.dirname(myna_file))
             ref_file = input_dict["GrainOrientationFile"]
 
             output_vtk = os.path.join(
@@ -91,4 +126,5 @@ class ExaCAMicrostructureRegionSlice(ExaCAMicrostructureRegion):
             )
 
             export_file = output_vtk.replace(".vtk", "_rgb.vtk")
-            add_rgb_to_vtk(output_vtk, export_file, ref_file)
+            rgb_tasks.append((output_vtk, export_file, ref_file))
+        self._export_rgb_vtks(rgb_tasks)
@@ -7,11 +7,20 @@
 # License: 3-clause BSD, see https://opensource.org/licenses/BSD-3-Clause.
 #
 import numpy as np
+import pandas as pd
 import time
+from scipy.spatial import cKDTree
 
 
 def rotate_grains(
-    dfMerged, gids, misorientation, update_ids, ref_or, ref_id, ref_cols_ids
+    dfMerged,
+    gids,
+    misorientation,
+    update_ids,
+    ref_or,
+    ref_id,
+    ref_cols_ids,
+    verbose=False,
 ):
     """Given a pandas DataFrame with Euler angles `phi1`, `Phi`, and `phi2`, rotate each
     grain voxel by the specified misorientation rate
@@ -31,81 +40,106 @@ def rotate_grains(
             orientations, with default ExaCA being N=10000
         ref_cols_ids: (list of ints) array of column indices for `phi1`, `Phi`, and
             `phi2` in `dfMerged`
+        verbose: (bool) controls progress output written to stdout
+
+    Returns:
+        dfMerged: (pandas DataFrame) the input DataFrame with rotated orientations
     """
 
-    for grain_index, gid in enumerate(gids):
-        # Print progress
-        print(f"Rotating grain index {gid} ({grain_index} of {len(gids)})")
-        t0 = time.perf_counter()
+    # Without a misorientation the orientations are unchanged, so there is nothing to
+    # do unless the rotation bookkeeping columns are requested
+    if misorientation == 0.0 and not update_ids:
+        return dfMerged
 
-        # Get grain points
-        if gid == 0:
+    # Copy the columns used by the rotation into NumPy arrays once for all grains.
+    # Updated arrays are written back to the DataFrame after all grains are rotated
+    z_arr = dfMerged["Z (m)"].to_numpy()
+    phi2_arr = dfMerged["phi2"].to_numpy(copy=True)
+    ref_col_arrs = [
+        phi2_arr if dfMerged.columns[i] == "phi2" else dfMerged.iloc[:, i].to_numpy()
+        for i in ref_cols_ids
+    ]
+    if update_ids:
+        ref_id_arr = dfMerged["Reference ID"].to_numpy(copy=True)
+        axis_dist_arr = dfMerged["axis_dist"].to_numpy(copy=True)
+        theta_arr = dfMerged["theta"].to_numpy(copy=True)
+
+        # Build the nearest-neighbor search tree of the reference orientations once
+        ref_tree = cKDTree(ref_or)
+
+    # Map grain IDs to contiguous codes in a single pass and sort the point indices
+    # by code once, so that the points of each grain are a contiguous slice of
+    # `order` bounded by `boundaries`
+    codes, uniques = pd.factorize(dfMerged["Grain ID"].to_numpy(), sort=False)
+    order = np.argsort(codes, kind="stable")
+    boundaries = np.searchsorted(codes[order], np.arange(len(uniques) + 1))
+    grain_codes = dict(zip(uniques.tolist(), range(len(uniques))))
+
+    # Get the Z extent of every grain from the sorted order, since grains without
+    # any extent along the rotation axis (Z) are not rotated
+    starts = boundaries[:-1]
+    if len(starts) > 0:
+        z_sorted = z_arr[order]
+        z_span = np.maximum.reduceat(z_sorted, starts) - np.minimum.reduceat(
+            z_sorted, starts
+        )
+
+    # Only rotate the grains with at least 100 points (excluding grain ID 0)
+    grain_slices = {}
+    for gid in gids:
+        k = grain_codes.get(gid)
+        if gid == 0 or k is None or boundaries[k + 1] - boundaries[k] < 100:
             continue
-        grain_indices = dfMerged[dfMerged["Grain ID"] == gid].index
-        if len(grain_indices) < 100:
+        if z_span[k] == 0.0:
             continue
-        print(f"\tProcessing {len(grain_indices)} grains")
+        grain_slices[gid] = slice(boundaries[k], boundaries[k + 1])
+    gids = list(grain_slices)
+
+    for grain_index, gid in enumerate(gids):
+        # Get grain points
+        grain_indices = order[grain_slices[gid]]
+
+        # Print progress
+        if verbose:
+            print(f"Rotating grain index {gid} ({grain_index} of {len(gids)})")
+            print(f"\tProcessing {len(grain_indices)} grains")
 
         # Calculate distance along rotation axis (Z)
-        col_id = dfMerged.columns.get_loc("Z (m)")
-        lengths = (
-            dfMerged.iloc[grain_indices, col_id].to_numpy()
-            - dfMerged.iloc[grain_indices, col_id].min()
-        )
+        grain_z = z_arr[grain_indices]
+        lengths = grain_z - grain_z.min()
 
         # Rotate grain orientation vectors (v) around major axis unit vector (k)
         # by angle (theta, radians) using Rodrigues' rotation formula
         thetas = np.radians(lengths * misorientation)
-        col_id = dfMerged.columns.get_loc("phi2")
-        dfMerged.iloc[grain_indices, col_id] = (
-            dfMerged.iloc[grain_indices, col_id].to_numpy() + thetas
-        )
+        phi2_arr[grain_indices] += thetas
 
-        # Update Reference IDs in merged DataFrame to match the
-        # rotated grain orientation vectors (if specified)
+        # Save rotated vectors (if Reference IDs are updated)
         if update_ids:
-            chunk_size = 25000
-            step = 0
-            while step * chunk_size <= len(grain_indices):
-                i0 = step * chunk_size
-                i1 = (step + 1) * chunk_size
-                print(f"\tUpdating grain id ({i0}-{i1} of {len(grain_indices)})")
-
-                # Construct array for rotated grain orientation vectors and reference vectors
-                if i1 >= len(grain_indices):
-                    orientation_vectors = dfMerged.iloc[
-                        grain_indices[i0:], ref_cols_ids
-                    ].to_numpy()
-                else:
-                    orientation_vectors = dfMerged.iloc[
-                        grain_indices[i0:i1], ref_cols_ids
-                    ].to_numpy()
-                orientation_vectors = np.repeat(
-                    orientation_vectors[np.newaxis, :], len(ref_or), axis=0
-                )
-                reference_vectors = np.repeat(
-                    ref_or[:, np.newaxis, :], orientation_vectors.shape[1], axis=1
-                )
-
-                # Calculate difference between rotated grain orientation vectors and reference vectors
-                diff = orientation_vectors - reference_vectors
-                norms = np.linalg.norm(diff, axis=2).T
-
-                # Find index of minimum difference for each rotated grain orientation vector
-                min_indices = np.argmin(norms, axis=1)
-
-                # Update reference IDs in merged DataFrame
-                col_id = dfMerged.columns.get_loc("Reference ID")
-                if i1 >= len(grain_indices):
-                    dfMerged.iloc[grain_indices[i0:], col_id] = ref_id[min_indices]
-                else:
-                    dfMerged.iloc[grain_indices[i0:i1], col_id] = ref_id[min_indices]
-                step += 1
-
-            # Save rotated vectors to merged DataFrame
-            col_id = dfMerged.columns.get_loc("axis_dist")
-            dfMerged.iloc[grain_indices, col_id] = lengths
-            col_id = dfMerged.columns.get_loc("theta")
-            dfMerged.iloc[grain_indices, col_id] = np.degrees(thetas)
-            t5 = time.perf_counter()
-            print(f"\tTime to perform grain rotations: {t5 - t0} s")
+            axis_dist_arr[grain_indices] = lengths
+            theta_arr[grain_indices] = np.degrees(thetas)
+
+    # Update Reference IDs to match the rotated grain orientation vectors (if
+    # specified). The nearest reference vector of every rotated point is found in a
+    # single parallel query of the search tree
+    if update_ids and len(gids) > 0:
+        t0 = time.perf_counter()
+        rotated_indices = np.concatenate([order[grain_slices[gid]] for gid in gids])
+        if verbose:
+            print(f"Updating grain ids of {len(rotated_indices)} rotated points")
+        rotated_orientations = np.column_stack(
+            [arr[rotated_indices] for arr in ref_col_arrs]
+        )
+        _, min_indices = ref_tree.query(rotated_orientations, k=1, workers=-1)
+        ref_id_arr[rotated_indices] = ref_id[min_indices]
+        if verbose:
+            t1 = time.perf_counter()
+            print(f"\tTime to update grain ids: {t1 - t0} s")
+
+    # Write the updated columns back to the merged DataFrame
+    dfMerged["phi2"] = phi2_arr
+    if update_ids:
+        dfMerged["Reference ID"] = ref_id_arr
+        dfMerged["axis_dist"] = axis_dist_arr
+        dfMerged["theta"] = theta_arr
+
+    return dfMerged
@@ -7,7 +7,6 @@
 # License: 3-clause BSD, see https://opensource.org/licenses/BSD-3-Clause.
 #
 import numpy as np
-import pandas as pd
 from vtk.util.numpy_support import vtk_to_numpy
 from vtk import vtkDataSetReader
 
@@ -29,16 +28,16 @@ def grain_id_reader(grain_id_file):
     return reader
 
 
-def vtk_structure_points_locs(structured_points):
-    """Returns arrays of x, y, and z coordinates for all points
+def vtk_structure_points_axes(structured_points):
+    """Returns the x, y, and z coordinates of the points along each axis
 
     Args:
         structured_points: vtkStructuredPoints object
 
     Returns:
-        x: x-coordinates as a numpy array
-        y: y-coordinates as a numpy array
-        z: z-coordinates as a numpy array
+        xs: x-coordinates of the points along the X-axis as a numpy array
+        ys: y-coordinates of the points along the Y-axis as a numpy array
+        zs: z-coordinates of the points along the Z-axis as a numpy array
     """
 
     # Get dimensions, origin, and spacing
@@ -51,34 +50,49 @@ def vtk_structure_points_locs(structured_points):
     ys = np.linspace(origin[1], origin[1] + (dims[1] - 1) * spacing[1], dims[1])
     zs = np.linspace(origin[2], origin[2] + (dims[2] - 1) * spacing[2], dims[2])
 
-    # Create meshgrid for the structured points and flatten
-    X, Y, Z = np.meshgrid(xs, ys, zs, indexing="ij")
-    df_points = pd.DataFrame(
-        {
-            "x": X.flatten(),
-            "y": Y.flatten(),
-            "z": Z.flatten(),
-        }
-    )
-    df_points.sort_values(by=["z", "y", "x"], inplace=True)
-    x = df_points["x"].to_numpy()
-    y = df_points["y"].to_numpy()
-    z = df_points["z"].to_numpy()
-
-    return [x, y, z]
+    return [xs, ys, zs]
 
 
-def vtk_unstructured_grid_locs(unstructured_grid):
+def vtk_structure_points_locs(structured_points, z_index=None):
     """Returns arrays of x, y, and z coordinates for all points
 
     Args:
-        unstructured_grid: vtkUnstructuredGrid object
+        structured_points: vtkStructuredPoints object
+        z_index: (optional int) index of a single Z-plane of points to return the
+            coordinates of, defaults to all points
 
     Returns:
         x: x-coordinates as a numpy array
         y: y-coordinates as a numpy array
         z: z-coordinates as a numpy array
     """
+    xs, ys, zs = vtk_structure_points_axes(structured_points)
+    if z_index is not None:
+        zs = zs[z_index : z_index + 1]
+
+    # Create meshgrid views for the structured points in the VTK point order (X varies
+    # fastest, then Y, then Z), and flatten each into a single new array
+    Z, Y, X = np.meshgrid(zs, ys, xs, indexing="ij", copy=False)
+    x = X.ravel()
+    y = Y.ravel()
+    z = Z.ravel()
+
+    return [x, y, z]
+
+
+def vtk_unstructured_grid_locs(unstructured_grid, dtype=None):
+    """Returns arrays of x, y, and z coordinates for all points
+
+    Args:
+        unstructured_grid: vtkUnstructuredGrid object
+        dtype: (optional) data type of the returned arrays, defaults to the data type
+            of the VTK points
+
+    Returns:
+        x: x-coordinates as a contiguous numpy array
+        y: y-coordinates as a contiguous numpy array
+        z: z-coordinates as a contiguous numpy array
+    """
 
     # Extract points
     points_vtk = unstructured_grid.GetPoints().GetData()
@@ -86,9 +100,11 @@ def vtk_unstructured_grid_locs(unstructured_grid):
     # Convert VTK points to a NumPy array
     points_np = vtk_to_numpy(points_vtk)
 
-    # Split into X, Y, and Z arrays
-    x = points_np[:, 0]
-    y = points_np[:, 1]
-    z = points_np[:, 2]
+    # Split into X, Y, and Z arrays with a single transposing copy, so that each
+    # coordinate array is contiguous instead of a strided view of the interleaved
+    # VTK points (and is cast to the requested type in the same pass)
+    if dtype is None:
+        dtype = points_np.dtype
+    x, y, z = np.array(points_np.T, dtype=dtype, order="C")
 
     return [x, y, z]
@@ -8,13 +8,140 @@
 #
 """Functions to create and manipulate OpenFOAM meshes"""
 
+import glob
+import gzip
 import os
 import re
+import shutil
 import subprocess
+from concurrent.futures import ThreadPoolExecutor
 import vtk
 import numpy as np
+from vtk.util.numpy_support import vtk_to_numpy  # ty: ignore[unresolved-import]
 from myna.core.utils import working_directory
 
+# Matches the contents of each parenthesized vector in OpenFOAM utility output
+_BB_RE = re.compile(r"\(([^)]+)")
+
+# Matches the cell count in the note of an OpenFOAM owner file header, e.g.,
+# note "nPoints:8 nCells:1 nFaces:6 nInternalFaces:0";
+_N_CELLS_RE = re.compile(rb"nCells:\s*(\d+)")
+
+# Buffer size for writing ASCII VTK files, large enough that each formatted chunk of
+# rows reaches the operating system in a few large writes
+_VTK_WRITE_BUFFER_SIZE = 1 << 22
+
+
+def _skip_whitespace_and_comments(text, i):
+    """Returns the index of the first character at or after `i` that is not
+    whitespace or part of a C/C++ style comment"""
+    n = len(text)
+    while i < n:
+        if text[i].isspace():
+            i += 1
+        elif text.startswith("//", i):
+            j = text.find("\n", i)
+            i = n if j < 0 else j + 1
+        elif text.startswith("/*", i):
+            j = text.find("*/", i + 2)
+            i = n if j < 0 else j + 2
+        else:
+            break
+    return i
+
+
+def _skip_string(text, i):
+    """Returns the index after the double-quoted string starting at `i`"""
+    j = i + 1
+    while j < len(text):
+        if text[j] == "\\":
+            j += 2
+        elif text[j] == '"':
+            return j + 1
+        else:
+            j += 1
+    raise ValueError("Unterminated string in OpenFOAM dictionary")
+
+
+def _find_closing_delimiter(text, i, terminator):
+    """Returns the index of `terminator` at the nesting depth of index `i`, skipping
+    strings, comments, and bracketed sub-expressions"""
+    depth = 0
+    while True:
+        i = _skip_whitespace_and_comments(text, i)
+        if i >= len(text):
+            raise ValueError(f"Missing '{terminator}' in OpenFOAM dictionary")
+        c = text[i]
+        if c == '"':
+            i = _skip_string(text, i)
+            continue
+        if depth == 0 and c == terminator:
+            return i
+        if c in "({[":
+            depth += 1
+        elif c in ")}]":
+            depth -= 1
+            if depth < 0:
+                raise ValueError("Unbalanced brackets in OpenFOAM dictionary")
+        i += 1
+
+
+def _dictionary_entries(text, start, end):
+    """Yields `(keyword, value_start, value_end, is_dict)` for each entry of the
+    OpenFOAM dictionary contents `text[start:end]`, where the value (or sub-dictionary
+    body) of the entry is `text[value_start:value_end]`"""
+    i = start
+    while True:
+        i = _skip_whitespace_and_comments(text, i)
+        if i >= end:
+            return
+        if text[i] == "#":
+            # Skip directives such as `#include`, which do not end with a semicolon
+            j = text.find("\n", i, end)
+            i = end if j < 0 else j + 1
+            continue
+        if text[i] == '"':
+            keyword_end = _skip_string(text, i)
+        else:
+            keyword_end = i
+            while keyword_end < end and not (
+                text[keyword_end].isspace()
+                or text[keyword_end] in '{}();"'
+                or text.startswith("//", keyword_end)
+                or text.startswith("/*", keyword_end)
+            ):
+                keyword_end += 1
+        if keyword_end == i:
+            raise ValueError("Unexpected delimiter in OpenFOAM dictionary")
+        keyword = text[i:keyword_end]
+        j = _skip_whitespace_and_comments(text, keyword_end)
+        if j < end and text[j] == "{":
+            close = _find_closing_delimiter(text, j + 1, "}")
+            yield keyword, j + 1, close, True
+        else:
+            close = _find_closing_delimiter(text, j, ";")
+            yield keyword, j, close, False
+        i = close + 1
+
+
+def _find_entry_value(text, entry):
+    """Returns the `(start, end)` span of the value of a `/`-separated entry in the
+    OpenFOAM dictionary contents `text`, or None if the entry is not a unique
+    (non-dictionary) entry of the contents"""
+    start, end = 0, len(text)
+    keys = entry.split("/")
+    for depth, key in enumerate(keys):
+        try:
+            matches = [x for x in _dictionary_entries(text, start, end) if x[0] == key]
+        except ValueError:
+            return None
+        if len(matches) != 1:
+            return None
+        _, start, end, is_dict = matches[0]
+        if is_dict == (depth == len(keys) - 1):
+            return None
+    return start, end
+
 
 def update_parameter(foamdict_file, entry, value):
     """Updates the given parameter in an OpenFOAM dictionary
@@ -25,18 +152,76 @@ def update_parameter(foamdict_file, entry, value):
         value: (str or numeric) value to write. If the value contains spaces it must be
             enclosed in doublequotes, e.g., `value='"test string"'`!
     """
+    update_parameters(foamdict_file, {entry: value})
+
 
-    os.system(f"foamDictionary -entry {entry} -set '{value}' {foamdict_file}")
+def update_parameters(foamdict_file, entries):
+    """Updates several parameters in an OpenFOAM dictionary at once
+
+    Entries that already exist in the dictionary are updated in-process with a single
+    read and write of the file. Entries that do not exist yet (or that could not be
+    located, e.g., in a dictionary that uses macro expansions for keywords) are set
+    with `foamDictionary`.
+
+    Args:
+        foamdict_file: (str) path to the OpenFOAM dictionary file
+        entries: (dict) mapping of each entry key (e.g., "geometry/refinementBox/min")
+            to the value to write, with the same value conventions as
+            `update_parameter()`
+    """
+    with open(foamdict_file, "r", encoding="utf-8") as f:
+        contents = f.read()
+
+    remaining = {}
+    updated_contents = contents
+    for entry, value in entries.items():
+        span = _find_entry_value(updated_contents, entry)
+        if span is None:
+            remaining[entry] = value
+            continue
+        value_start, value_end = span
+        separator = " " if value_start == value_end else ""
+        updated_contents = (
+            updated_contents[:value_start]
+            + f"{separator}{value}"
+            + updated_contents[value_end:]
+        )
+
+    if updated_contents != contents:
+        with open(foamdict_file, "w", encoding="utf-8") as f:
+            f.write(updated_contents)
+    for entry, value in remaining.items():
+        subprocess.run(
+            ["foamDictionary", "-entry", entry, "-set", str(value), foamdict_file],
+            check=False,
+        )
+
+
+def get_matching_output_lines(args, match):
+    """Runs the command and returns the lines of its output containing `match`
+
+    Args:
+        args: (list) list of command arguments passed to subprocess.run
+        match: (str) case-insensitive text that the returned lines must contain
+
+    Returns:
+        (str) the matching output lines, each ending with a newline
+    """
+    output = subprocess.run(
+        args, capture_output=True, text=True, check=False
+    ).stdout.splitlines(keepends=True)
+    match = match.lower()
+    return "".join(line for line in output if match in line.lower())
 
 
 def run_command(args, app=None, parallel=None, **kwargs):
     """Runs the command, using app functions if they are present
 
     Args:
-        args: (list) list of command arguments passed to Popen
+        args: (list) list of command arguments passed to subprocess.run
         app: (MynaApp instance) if provided, will use MynaApp job submission
         parallel: (bool) if provided, will use parallel options for MynaApp job
-        **kwargs: additional options passed to subprocess.Popen"""
+        **kwargs: additional options passed to subprocess.run"""
 
     if app is not None:
         if parallel is not None:
@@ -47,8 +232,97 @@ def run_command(args, app=None, parallel=None, **kwargs):
                 p.wait()
     else:
         print(f"myna subprocess: {args}")
-        with subprocess.Popen(args, **kwargs) as p:
-            p.wait()
+        subprocess.run(args, check=False, **kwargs)
+
+
+def _remove_path(path):
+    """Removes a file or directory, ignoring a path that does not exist"""
+    if os.path.isdir(path) and not os.path.islink(path):
+        shutil.rmtree(path, ignore_errors=True)
+    elif os.path.lexists(path):
+        os.remove(path)
+
+
+def remove_paths(paths, max_workers=4):
+    """Removes files and directories in-process, ignoring paths that do not exist
+
+    Independent removals (e.g., the `processor*` directories of a decomposed case)
+    run concurrently so that their filesystem latencies overlap.
+
+    Args:
+        paths: (list of str) paths of the files and directories to remove
+        max_workers: (int) maximum number of concurrent removals
+    """
+    paths = list(paths)
+    if len(paths) < 2 or max_workers < 2:
+        for path in paths:
+            _remove_path(path)
+        return
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(paths))) as executor:
+        for future in [executor.submit(_remove_path, path) for path in paths]:
+            future.result()
+
+
+def get_parameter(foamdict_file, entry):
+    """Returns the value of the given parameter in an OpenFOAM dictionary
+
+    Args:
+        foamdict_file: (str) path to the OpenFOAM dictionary file
+        entry: (str) key for the entry, e.g., "castellatedMeshControls/maxGlobalCells"
+
+    Returns:
+        (str) the value of the entry, or None if the entry is not found
+    """
+    with open(foamdict_file, "r", encoding="utf-8") as f:
+        contents = f.read()
+    span = _find_entry_value(contents, entry)
+    if span is not None:
+        return contents[span[0] : span[1]].strip()
+
+    # Entries defined in included files (e.g., snappyHexMesh defaults from
+    # `#includeEtc`) are looked up with `foamDictionary`
+    try:
+        result = subprocess.run(
+            ["foamDictionary", "-entry", entry, "-value", "-expand", foamdict_file],
+            capture_output=True,
+            text=True,
+            check=False,
+        )
+    except OSError:
+        return None
+    value = result.stdout.strip()
+    if result.returncode != 0 or value == "":
+        return None
+    return value
+
+
+def set_snappy_max_local_cells(args, case_dir, nprocs):
+    """Sets `maxLocalCells` of a parallel snappyHexMesh run to the per-processor share
+    of `maxGlobalCells`, so the refinement of each processor is balanced against the
+    global cell limit instead of the (much smaller) default local limit
+
+    Args:
+        args: (list) snappyHexMesh command arguments
+        case_dir: (str) path to case directory
+        nprocs: (int) number of processors of the parallel run
+    """
+    if "-dict" in args:
+        snappy_dict = args[args.index("-dict") + 1]
+    else:
+        snappy_dict = f"{case_dir}/system/snappyHexMeshDict"
+
+    max_global_cells = get_parameter(
+        snappy_dict, "castellatedMeshControls/maxGlobalCells"
+    )
+    try:
+        max_global_cells = int(float(max_global_cells))
+    except (TypeError, ValueError):
+        return
+    update_parameter(
+        snappy_dict,
+        "castellatedMeshControls/maxLocalCells",
+        max(1, max_global_cells // nprocs),
+    )
 
 
 def run_command_with_decompose_reconstruct(args, case_dir, app=None):
@@ -57,10 +331,23 @@ def run_command_with_decompose_reconstruct(args, case_dir, app=None):
     if app is not None:
         parallel = app.args.np > 1
 
+    # Each subdomain of the decomposition needs at least one cell
+    if parallel:
+        n_cells = get_mesh_n_cells(case_dir)
+        if n_cells is not None and n_cells < app.args.np:
+            parallel = False
+
     if parallel:
-        # Decompose the case for meshing
-        update_parameter(
-            f"{case_dir}/system/decomposeParDict", "numberOfSubdomains", app.args.np
+        # Split the global cell limit of snappyHexMesh evenly across the processors
+        if args[0] == "snappyHexMesh":
+            set_snappy_max_local_cells(args, case_dir, app.args.np)
+
+        # Decompose the case for meshing. Scotch balances the subdomains by itself, so
+        # unlike the geometric methods it needs no coefficients matching the number of
+        # subdomains
+        update_parameters(
+            f"{case_dir}/system/decomposeParDict",
+            {"numberOfSubdomains": app.args.np, "method": "scotch"},
         )
         run_command(["decomposePar", "-case", case_dir, "-force"])
 
@@ -71,7 +358,7 @@ def run_command_with_decompose_reconstruct(args, case_dir, app=None):
     if parallel:
         # Reconstruct the case
         run_command(["reconstructParMesh", "-case", case_dir, "-withZero", "-constant"])
-        run_command(["rm", "-rf", f"{case_dir}/processor*"])
+        remove_paths(glob.glob(os.path.join(case_dir, "processor*")))
 
 
 def preprocess_stl(case_dir, stl_path, convert_to_meters=1):
@@ -87,19 +374,23 @@ def preprocess_stl(case_dir, stl_path, convert_to_meters=1):
     working_stl_dir = os.path.join(case_dir, "constant", "triSurface")
     working_stl_path = os.path.join(working_stl_dir, stl_file_name)
 
-    run_command(["mkdir", "-p", working_stl_dir])
-    run_command(["cp", "-rf", stl_path, working_stl_dir])
-
-    # scale the stl file to meters
-    scaling = " ".join(str(convert_to_meters) for _ in range(3))
-    run_command(
-        [
-            "surfaceTransformPoints",
-            f'"scale=({scaling})"',
-            working_stl_path,
-            working_stl_path,
-        ]
-    )
+    os.makedirs(working_stl_dir, exist_ok=True)
+    if not os.path.exists(working_stl_path) or not os.path.samefile(
+        stl_path, working_stl_path
+    ):
+        shutil.copy2(stl_path, working_stl_path)
+
+    # scale the stl file to meters, unless it is already in meters
+    if convert_to_meters != 1:
+        scaling = " ".join(str(convert_to_meters) for _ in range(3))
+        run_command(
+            [
+                "surfaceTransformPoints",
+                f"scale=({scaling})",
+                working_stl_path,
+                working_stl_path,
+            ]
+        )
 
     # generic surface clean (removes ambiguous patches in stl file)
     run_command(["surfaceClean", working_stl_path, working_stl_path, "0", "0"])
@@ -112,56 +403,199 @@ def extract_stl_features(case_dir, stl_path, refinement_level, origin):
 
     stl_file_name = os.path.basename(stl_path)
 
-    # extract the surface features from the stl file
+    # extract the surface features from the stl file. surfaceFeatures operates on the
+    # global STL and has no parallel mode, so it always runs serially (without the
+    # app's MPI launch) on the undecomposed case
     surface_features_dict = f"{case_dir}/system/surfaceFeaturesDict"
-    update_parameter(surface_features_dict, "surfaces", f'( "{stl_file_name}" )')
-    run_command(["surfaceFeatures", "-case", case_dir])
+    update_parameters(surface_features_dict, {"surfaces": f'( "{stl_file_name}" )'})
+    run_command(["surfaceFeatures", "-case", case_dir], app=None)
     emesh_name = stl_file_name.split(".")[0] + ".eMesh"
 
     # update entries is snappyHexMeshDict
     snappyhexmesh_dict = f"{case_dir}/system/snappyHexMeshDict"
     origin = " ".join(list(map(str, origin)))
 
-    update_parameter(snappyhexmesh_dict, "geometry/part/file", f'"{stl_file_name}"')
-    update_parameter(
+    update_parameters(
         snappyhexmesh_dict,
-        "castellatedMeshControls/features",
-        f'( {"{"} file "{emesh_name}"; level {refinement_level}; {"}"} )',
+        {
+            "geometry/part/file": f'"{stl_file_name}"',
+            "castellatedMeshControls/features": (
+                f'( {"{"} file "{emesh_name}"; level {refinement_level}; {"}"} )'
+            ),
+            "castellatedMeshControls/locationInMesh": f"( {origin} )",
+            "castellatedMeshControls/refinementSurfaces/part/level": (
+                f"( {refinement_level} {refinement_level} )"
+            ),
+            "castellatedMeshControls/refinementRegions/part/levels": (
+                f"( ( {refinement_level} {refinement_level} ) )"
+            ),
+        },
     )
-    update_parameter(
-        snappyhexmesh_dict, "castellatedMeshControls/locationInMesh", f"( {origin} )"
-    )
-    update_parameter(
-        snappyhexmesh_dict,
-        "castellatedMeshControls/refinementSurfaces/part/level",
-        f"( {refinement_level} {refinement_level} )",
-    )
-    update_parameter(
-        snappyhexmesh_dict,
-        "castellatedMeshControls/refinementRegions/part/levels",
-        f"( ( {refinement_level} {refinement_level} ) )",
+
+
+def parse_bounding_box(s):
+    """Parse the first bounding box printed by an OpenFOAM utility
+
+    Args:
+        s: (str) utility output containing a bounding box, e.g.,
+            "Overall domain bounding box (0 0 0) (1 1 1)"
+
+    Returns:
+        (np.array(2,3)) bounding box ((xmin, ymin, zmin), (xmax, ymax, zmax))
+    """
+    bb_str = _BB_RE.findall(s)
+    return np.array(
+        [np.fromstring(bb_str[0], sep=" "), np.fromstring(bb_str[1], sep=" ")]
     )
 
 
 def construct_bounding_box_dict(rve, rve_pad):
     """Construct a dictionary to define the bounding box properties
 
+    The "bb_min" and "bb_max" entries are views of the rows of the "bb" array, so
+    updating a bound in "bb" also updates them.
+
     Args:
         rve: (np.array(3,2))
     """
-    bb_min = [rve[0][0] - rve_pad[0], rve[0][1] - rve_pad[1], rve[0][2] - rve_pad[2]]
-    bb_max = [rve[1][0] + rve_pad[0], rve[1][1] + rve_pad[1], rve[1][2]]
-    span = [b - a for (a, b) in zip(bb_min, bb_max)]
-    origin = [a + b / 2.0 for (a, b) in zip(bb_min, span)]
+    rve = np.asarray(rve, dtype=float)
+    rve_pad = np.asarray(rve_pad, dtype=float)
+
+    # The maximum Z bound is not padded
+    bb = np.empty((2, 3))
+    np.subtract(rve[0], rve_pad, out=bb[0])
+    np.add(rve[1], rve_pad * np.array([1.0, 1.0, 0.0]), out=bb[1])
+    span = bb[1] - bb[0]
     return {
-        "bb_min": bb_min,
-        "bb_max": bb_max,
-        "bb": np.array([bb_min, bb_max]),
+        "bb_min": bb[0],
+        "bb_max": bb[1],
+        "bb": bb,
         "span": span,
-        "origin": origin,
+        "origin": bb[0] + span * 0.5,
     }
 
 
+def _find_polymesh_file(case_dir, name):
+    """Returns the path to a (possibly compressed) mesh file of a case, or None if the
+    file does not exist"""
+    for file_name in [name, f"{name}.gz"]:
+        path = os.path.join(case_dir, "constant", "polyMesh", file_name)
+        if os.path.isfile(path):
+            return path
+    return None
+
+
+def get_mesh_n_cells(case_dir):
+    """Returns the number of cells of the mesh of an existing OpenFOAM case
+
+    The number of cells is read from the note in the header of the
+    `constant/polyMesh/owner` file, without reading the mesh itself.
+
+    Args:
+        case_dir: (str) path to case directory
+
+    Returns:
+        (int) number of mesh cells, or None if the owner file is missing or its header
+            has no cell count
+    """
+    owner_file = _find_polymesh_file(case_dir, "owner")
+    if owner_file is None:
+        return None
+    try:
+        if owner_file.endswith(".gz"):
+            with gzip.open(owner_file, "rb") as f:
+                header = f.read(4096)
+        else:
+            with open(owner_file, "rb") as f:
+                header = f.read(4096)
+    except OSError:
+        return None
+    match = _N_CELLS_RE.search(header)
+    return int(match.group(1)) if match else None
+
+
+def read_mesh_points(case_dir):
+    """Reads the mesh points of an OpenFOAM case from `constant/polyMesh/points`
+
+    Supports ASCII and binary point files, with or without compression.
+
+    Args:
+        case_dir: (str) path to case directory
+
+    Returns:
+        (np.array(N,3)) coordinates of the mesh points
+    """
+    points_file = _find_polymesh_file(case_dir, "points")
+    if points_file is None:
+        raise FileNotFoundError(f"No mesh points file in {case_dir}/constant/polyMesh")
+    if points_file.endswith(".gz"):
+        with gzip.open(points_file, "rb") as f:
+            contents = f.read()
+    else:
+        with open(points_file, "rb") as f:
+            contents = f.read()
+
+    # Parse the FoamFile header for the storage format and scalar size
+    header_start = contents.find(b"FoamFile")
+    header_end = contents.find(b"}", header_start)
+    if header_start < 0 or header_end < 0:
+        raise ValueError(f"Missing FoamFile header in {points_file}")
+    header = contents[header_start:header_end].decode("utf-8", errors="replace")
+    binary = re.search(r"format\s+binary\s*;", header) is not None
+    scalar_match = re.search(r"scalar\s*=\s*(\d+)", header)
+    scalar_bits = int(scalar_match.group(1)) if scalar_match else 64
+    byte_order = ">" if "MSB" in header else "<"
+
+    # The header is followed by the number of points and the opening parenthesis of
+    # the point list
+    count_match = re.compile(rb"\s*(?://[^\n]*\s*)*(\d+)\s*\(").match(
+        contents, header_end + 1
+    )
+    if count_match is None:
+        raise ValueError(f"Could not find the point list in {points_file}")
+    n_points = int(count_match.group(1))
+    list_start = count_match.end()
+
+    if binary:
+        dtype = np.dtype(f"{byte_order}f{scalar_bits // 8}")
+        points = np.frombuffer(
+            contents, dtype=dtype, count=3 * n_points, offset=list_start
+        )
+    else:
+        list_end = contents.rfind(b")")
+        values = contents[list_start:list_end].translate(None, b"()")
+        points = np.fromstring(values.decode("ascii"), sep=" ")
+    if points.size != 3 * n_points:
+        raise ValueError(f"Expected {n_points} points in {points_file}")
+    return points.reshape(n_points, 3).astype(np.float64, copy=False)
+
+
+def get_mesh_bounding_box(case_dir):
+    """Returns the bounding box of the mesh of an existing OpenFOAM case
+
+    The bounding box is computed directly from the mesh points file, falling back to
+    the bounding box reported by `checkMesh` if the points file cannot be read.
+
+    Args:
+        case_dir: (str) path to case directory
+
+    Returns:
+        (np.array(2,3)) bounding box ((xmin, ymin, zmin), (xmax, ymax, zmax))
+    """
+    try:
+        points = read_mesh_points(case_dir)
+        if len(points) == 0:
+            raise ValueError(f"Mesh of {case_dir} has no points")
+        bb = np.stack([points.min(axis=0), points.max(axis=0)])
+    except (OSError, ValueError):
+        s = get_matching_output_lines(
+            ["checkMesh", "-case", case_dir, "-noTopology"],
+            "Overall domain bounding box",
+        )
+        bb = parse_bounding_box(s)
+    return bb
+
+
 def construct_mesh_bounding_box_dict(case_dir, tolerance=1e-8):
     """Construct a dictionary to define the bounding box properties based on the mesh
     of an existing OpenFOAM case
@@ -170,19 +604,8 @@ def construct_mesh_bounding_box_dict(case_dir, tolerance=1e-8):
         case_dir: (str) path to case directory
         tolerance: (float) tolerance used to pad the edge of the bounding box
     """
-    s = subprocess.check_output(
-        f"checkMesh -case {case_dir} -noTopology | grep -i 'Overall domain bounding box'",
-        shell=True,
-    ).decode("utf-8")
-
-    bb_str = re.findall(r"\(([^)]+)", s)
     tolerance = 1e-8
-    rve = np.array(
-        [
-            [float(x) for x in bb_str[0].split(" ")],
-            [float(x) for x in bb_str[1].split(" ")],
-        ]
-    )
+    rve = get_mesh_bounding_box(case_dir)
     rve_pad = np.array([tolerance, tolerance, tolerance])
     bb_dict = construct_bounding_box_dict(rve, rve_pad)
     return bb_dict
@@ -196,7 +619,8 @@ def calc_n_cells(bb_dict, spacing):
             `construct_bounding_box_dict()`
         spacing: (float) mesh spacing, in meters
     """
-    return np.array([round(a / b) for (a, b) in zip(bb_dict["span"], spacing)])
+    span = np.asarray(bb_dict["span"], dtype=float)
+    return np.rint(span / np.asarray(spacing)).astype(np.int64)
 
 
 def create_cube_mesh(case_dir, spacing, rve, rve_pad):
@@ -216,11 +640,9 @@ def create_cube_mesh(case_dir, spacing, rve, rve_pad):
     # update blockMeshDict file in the case directory
     block_mesh_dict = os.path.join(case_dir, "system/blockMeshDict")
     keys = ["xmin", "ymin", "zmin", "xmax", "ymax", "zmax"]
-    for k, key in enumerate(keys):
-        update_parameter(block_mesh_dict, key, bb_dict["bb"].flatten()[k])
-    keys = ["nx", "ny", "nz"]
-    for k, key in enumerate(keys):
-        update_parameter(block_mesh_dict, key, n_cells[k])
+    entries = dict(zip(keys, bb_dict["bb"].flatten()))
+    entries.update(zip(["nx", "ny", "nz"], n_cells))
+    update_parameters(block_mesh_dict, entries)
 
     run_command(["blockMesh", "-case", case_dir])
 
@@ -231,85 +653,216 @@ def create_stl_cube_mesh(case_dir, working_stl_path, spacing, tolerance):
     """create a background mesh using blockMesh around the stl file"""
 
     # get the bounding box of the stl to create background mesh
-    s = subprocess.check_output(
-        f"surfaceCheck {working_stl_path} | grep -i 'Bounding Box :'", shell=True
-    ).decode("utf-8")
-    bb_str = re.findall(r"\(([^)]+)", s)
-    rve = np.array(
-        [
-            [float(x) for x in bb_str[0].split(" ")],
-            [float(x) for x in bb_str[1].split(" ")],
-        ]
-    )
+    s = get_matching_output_lines(["surfaceCheck", working_stl_path], "Bounding Box :")
+    rve = parse_bounding_box(s)
     rve_pad = np.array([tolerance, tolerance, tolerance])
     bb_dict = create_cube_mesh(case_dir, spacing, rve, rve_pad)
 
     return bb_dict
 
 
+def translate_mesh_z(case_dir, dz, tolerance=1e-14):
+    """Translate the mesh of a case along the z-axis with a single `transformPoints`
+    call, skipping the call if the mesh is already aligned
+
+    Args:
+        case_dir: (str) path to case directory
+        dz: (float) translation along the z-axis, in mesh units
+        tolerance: (float) translations smaller than this magnitude are skipped
+    """
+    if abs(dz) < tolerance:
+        return
+    translation = " ".join(str(t) for t in [0, 0, dz])
+    run_command(["transformPoints", "-case", case_dir, f"translate=({translation})"])
+
+
 def create_part_mesh(case_dir, stl_path, bb_dict, app=None):
-    """create the part mesh"""
+    """create the part mesh
+
+    Expects the background mesh (`create_stl_cube_mesh()`) and the STL features
+    (`extract_stl_features()`, serial) to already exist in the case. Only
+    snappyHexMesh runs in parallel, between decomposePar and reconstructParMesh.
+    """
 
     snappy_args = ["snappyHexMesh", "-case", case_dir, "-overwrite"]
     run_command_with_decompose_reconstruct(snappy_args, case_dir, app=app)
 
     # move bottom of mesh to z=0 plane
-    translation = " ".join(str(t) for t in [0, 0, -bb_dict["bb_min"][2]])
-    run_command(["transformPoints", "-case", case_dir, f'"translate=({translation})"'])
+    translate_mesh_z(case_dir, -bb_dict["bb_min"][2])
 
     # save a copy of polyMesh for the part in the working directory
     stl_file_name = os.path.basename(stl_path)
     polymesh_copy = f"{case_dir}/{stl_file_name.split('.')[0]}.polyMesh"
-    run_command(["cp", "-rf", f"{case_dir}/constant/polyMesh", polymesh_copy])
+    shutil.copytree(f"{case_dir}/constant/polyMesh", polymesh_copy, dirs_exist_ok=True)
 
 
-def foam_to_adamantine(case_dir, precision=8):
-    """convert OpenFOAM VTK format to adamantine VTK format"""
+def _get_cell_types(grid):
+    """Returns the VTK cell type of each cell of an unstructured grid as a NumPy array"""
+    try:
+        # VTK >= 9.6
+        cell_types = grid.GetCellTypes()
+    except TypeError:
+        cell_types = grid.GetCellTypesArray()
+    return vtk_to_numpy(cell_types)
 
-    # Create OpenFOAM VTK file
-    run_command(["foamToVTK", "-case", case_dir, "-constant", "-ascii"])
-    vtk_file_path = os.path.join(case_dir, "VTK", os.path.basename(case_dir) + "_0.vtk")
 
-    # Read the OpenFOAM VTK file
-    reader = vtk.vtkUnstructuredGridReader()  # pylint: disable=no-member
-    reader.SetFileName(vtk_file_path)
-    reader.Update()
-    grid = reader.GetOutput()
+def _write_formatted_rows(f, line_format, values, chunk_size=100000):
+    """Write rows of values to a text file, formatting each chunk of rows at once
+
+    Args:
+        f: open text file to write to
+        line_format: (str) %-style format of a single row, including the newline
+        values: (np.array) 2D array with a row of values for each line
+        chunk_size: (int) number of rows to format per write
+    """
+    for i0 in range(0, len(values), chunk_size):
+        chunk = values[i0 : i0 + chunk_size]
+        f.write((line_format * len(chunk)) % tuple(chunk.ravel().tolist()))
+
+
+def _write_cells(f, offsets, connectivity, cell_sizes, chunk_size=100000):
+    """Write the legacy VTK cell list, i.e., the number of points of each cell followed
+    by its point IDs, one cell per line
+
+    Args:
+        f: open text file to write to
+        offsets: (np.array) offsets of each cell into the connectivity array
+        connectivity: (np.array) point IDs of all cells
+        cell_sizes: (np.array) number of points of each cell
+        chunk_size: (int) number of cells to format per write
+    """
+    if len(cell_sizes) == 0:
+        return
+
+    # Grids with a single cell type (e.g., all hexahedra) share one row format
+    if np.all(cell_sizes == cell_sizes[0]):
+        n = int(cell_sizes[0])
+        _write_formatted_rows(
+            f, str(n) + " %d" * n + "\n", connectivity.reshape(-1, n), chunk_size
+        )
+        return
+
+    # Mixed grids insert the size of each cell before its point IDs, one slice of
+    # cells at a time
+    for i0 in range(0, len(cell_sizes), chunk_size):
+        i1 = min(i0 + chunk_size, len(cell_sizes))
+        chunk_offsets = offsets[i0 : i1 + 1] - offsets[i0]
+        chunk_sizes = cell_sizes[i0:i1]
+        cell_list = np.insert(
+            connectivity[offsets[i0] : offsets[i1]], chunk_offsets[:-1], chunk_sizes
+        )
+        cell_ends = chunk_offsets[1:] + np.arange(len(chunk_sizes))
+        separators = np.full(len(cell_list), " ")
+        separators[cell_ends] = "\n"
+        f.write(
+            "".join(
+                entry + separator
+                for entry, separator in zip(
+                    map(str, cell_list.tolist()), separators.tolist()
+                )
+            )
+        )
+
+
+def write_adamantine_vtk(grid, vtk_file_path, precision=8):
+    """Write an unstructured grid to an ASCII VTK file in the adamantine format
+
+    Args:
+        grid: vtkUnstructuredGrid object to write
+        vtk_file_path: (str) path of the VTK file to write
+        precision: (int) number of decimal places of the point coordinates
+    """
+    # Get the points, cells, and cell types as NumPy arrays
+    points = vtk_to_numpy(grid.GetPoints().GetData())
+    cells = grid.GetCells()
+    offsets = vtk_to_numpy(cells.GetOffsetsArray())
+    connectivity = vtk_to_numpy(cells.GetConnectivityArray())
+    cell_types = _get_cell_types(grid)
+
+    cell_sizes = np.diff(offsets)
 
     # Write the Adamantine VTK file
-    with open(vtk_file_path, "w", encoding="utf-8") as f:
+    with open(
+        vtk_file_path, "w", encoding="utf-8", buffering=_VTK_WRITE_BUFFER_SIZE
+    ) as f:
         f.write("# vtk DataFile Version 3.0\n")
         f.write("****\n")
         f.write("ASCII\n")
         f.write("DATASET UNSTRUCTURED_GRID\n")
 
         # Write points
-        f.write(f"POINTS {grid.GetNumberOfPoints()} float\n")
-        for i in range(grid.GetNumberOfPoints()):
-            point = grid.GetPoint(i)
-            f.write(
-                f"{point[0]:.{precision}f} {point[1]:.{precision}f} {point[2]:.{precision}f}\n"
-            )
+        f.write(f"POINTS {len(points)} float\n")
+        point_format = " ".join([f"%.{precision}f"] * 3) + "\n"
+        _write_formatted_rows(f, point_format, points)
 
         # Write cells
-        f.write(
-            f"CELLS {grid.GetNumberOfCells()} {grid.GetCells().GetData().GetNumberOfTuples()}\n"
-        )
-        id_list = vtk.vtkIdList()  # pylint: disable=no-member
-        for i in range(grid.GetNumberOfCells()):
-            grid.GetCellPoints(i, id_list)
-            f.write(
-                f"{id_list.GetNumberOfIds()} "
-                + " ".join(
-                    [str(id_list.GetId(j)) for j in range(id_list.GetNumberOfIds())]
-                )
-                + "\n"
-            )
+        f.write(f"CELLS {len(cell_sizes)} {len(cell_sizes) + len(connectivity)}\n")
+        _write_cells(f, offsets, connectivity, cell_sizes)
 
         # Write cell types
-        f.write(f"CELL_TYPES {grid.GetNumberOfCells()}\n")
-        for i in range(grid.GetNumberOfCells()):
-            f.write(f"{grid.GetCellType(i)}\n")
+        f.write(f"CELL_TYPES {len(cell_types)}\n")
+        _write_formatted_rows(f, "%d\n", cell_types.reshape(-1, 1))
+
+
+def read_foam_mesh(case_dir):
+    """Read the internal mesh of an OpenFOAM case directly from its polyMesh files
+
+    Args:
+        case_dir: (str) path to case directory
+
+    Returns:
+        vtkUnstructuredGrid of the internal mesh, or None if it could not be read
+    """
+    if not os.path.isdir(os.path.join(case_dir, "constant", "polyMesh")):
+        return None
+
+    # The VTK OpenFOAM reader locates the case from a (possibly empty) `.foam` file
+    foam_file = os.path.join(case_dir, os.path.basename(case_dir) + ".foam")
+    created_foam_file = not os.path.exists(foam_file)
+    if created_foam_file:
+        with open(foam_file, "w", encoding="utf-8"):
+            pass
+    try:
+        reader = vtk.vtkOpenFOAMReader()  # pylint: disable=no-member
+        reader.SetFileName(foam_file)
+        reader.CreateCellToPointOff()
+        reader.Update()
+        output = reader.GetOutput()
+    finally:
+        if created_foam_file:
+            os.remove(foam_file)
+
+    for i in range(output.GetNumberOfBlocks()):
+        name = output.GetMetaData(i).Get(vtk.vtkCompositeDataSet.NAME())
+        if name == "internalMesh":
+            return output.GetBlock(i)
+    return None
+
+
+def foam_to_adamantine(case_dir, precision=8):
+    """convert OpenFOAM VTK format to adamantine VTK format"""
+
+    vtk_file_path = os.path.join(case_dir, "VTK", os.path.basename(case_dir) + "_0.vtk")
+
+    # Read the mesh directly from the polyMesh files when all cells are hexahedra,
+    # which need no decomposition, to avoid writing and reading an intermediate file
+    grid = read_foam_mesh(case_dir)
+    if grid is None or not np.all(_get_cell_types(grid) == vtk.VTK_HEXAHEDRON):
+        # Create OpenFOAM VTK file, which decomposes any polyhedral cells. The
+        # intermediate file is only read back by VTK, so it is written in the default
+        # binary legacy format to avoid formatting and parsing the mesh as text twice
+        run_command(["foamToVTK", "-case", case_dir, "-constant"])
+
+        # Read the OpenFOAM VTK file
+        reader = vtk.vtkUnstructuredGridReader()  # pylint: disable=no-member
+        reader.SetFileName(vtk_file_path)
+        reader.Update()
+        grid = reader.GetOutput()
+    else:
+        os.makedirs(os.path.dirname(vtk_file_path), exist_ok=True)
+
+    # Write the Adamantine VTK file
+    write_adamantine_vtk(grid, vtk_file_path, precision=precision)
 
     return vtk_file_path
 
@@ -324,25 +877,24 @@ def slice_part_mesh(case_dir, height):
     # Update topoSetDict parameters
     toposetdict = f"{case_dir}/system/topoSetDict"
     keys = ["xmin", "ymin", "zmin", "xmax", "ymax", "zmax"]
-    for k, key in enumerate(keys):
-        update_parameter(toposetdict, key, bb_dict["bb"].flatten()[k])
+    update_parameters(toposetdict, dict(zip(keys, bb_dict["bb"].flatten())))
 
     # Remove the created cellSet and renumber new mesh
     run_command(["topoSet", "-case", case_dir])
     run_command(["subsetMesh", "-case", case_dir, "-overwrite", "c0", "-patch", "part"])
-    run_command(["rm", "-rf", f"{case_dir}/constant/polyMesh/sets"])
-    run_command(["rm", "-rf", f"{case_dir}/constant/polyMesh/cellLevel"])
-    run_command(["rm", "-rf", f"{case_dir}/constant/polyMesh/pointLevel"])
+    remove_paths(
+        [
+            f"{case_dir}/constant/polyMesh/sets",
+            f"{case_dir}/constant/polyMesh/cellLevel",
+            f"{case_dir}/constant/polyMesh/pointLevel",
+        ]
+    )
     run_command(["renumberMesh", "-case", case_dir, "-overwrite"])
 
-    # Align the sliced mesh with the top at z=0 plane
-    s = subprocess.check_output(
-        f'checkMesh -case {case_dir} -noTopology | grep -i "Overall domain bounding box"',
-        shell=True,
-    ).decode("utf-8")
-    zmax = float(re.findall(r"\(([^)]+)", s)[-1].split(" ")[-1])
-    translation = " ".join(str(t) for t in [0, 0, -zmax])
-    run_command(["transformPoints", "-case", case_dir, f'"translate=({translation})"'])
+    # Align the sliced mesh with the top at z=0 plane. The top of the sliced mesh is
+    # the top face of the highest selected cell, which is not necessarily `height`
+    zmax = get_mesh_bounding_box(case_dir)[1, 2]
+    translate_mesh_z(case_dir, -zmax)
 
 
 def refine_mesh_in_box(case_dir, bb, app=None, refinement_dict=None):
@@ -358,30 +910,21 @@ def refine_mesh_in_box(case_dir, bb, app=None, refinement_dict=None):
             for refinement. If None, will default to `system/refineMeshDict`.
     """
 
-    center = [
-        0.5 * (bb[0][0] + bb[1][0]),
-        0.5 * (bb[0][1] + bb[1][1]),
-        0.5 * (bb[0][2] + bb[1][2]),
-    ]
+    center = np.asarray(bb, dtype=float).mean(axis=0)
 
     if refinement_dict is None:
         refine_mesh_dict = f"{case_dir}/system/refineMeshDict"
     else:
         refine_mesh_dict = refinement_dict
-    update_parameter(
-        refine_mesh_dict,
-        "geometry/refinementBox/min",
-        f"( {bb[0][0]} {bb[0][1]} {bb[0][2]} )",
-    )
-    update_parameter(
-        refine_mesh_dict,
-        "geometry/refinementBox/max",
-        f"( {bb[1][0]} {bb[1][1]} {bb[1][2]} )",
-    )
-    update_parameter(
+    update_parameters(
         refine_mesh_dict,
-        "castellatedMeshControls/locationInMesh",
-        f"( {center[0]} {center[1]} {center[2]} )",
+        {
+            "geometry/refinementBox/min": f"( {bb[0][0]} {bb[0][1]} {bb[0][2]} )",
+            "geometry/refinementBox/max": f"( {bb[1][0]} {bb[1][1]} {bb[1][2]} )",
+            "castellatedMeshControls/locationInMesh": (
+                f"( {center[0]} {center[1]} {center[2]} )"
+            ),
+        },
     )
 
     with working_directory(case_dir):
@@ -403,33 +946,22 @@ def refine_layer(case_dir, refinement_depth, refinement_level, app=None):
     bb_dict = construct_mesh_bounding_box_dict(case_dir)
     bb = bb_dict["bb"]
     bb[0][2] = max(bb[0][2], -refinement_depth)
-    center = [
-        0.5 * (bb[0][0] + bb[1][0]),
-        0.5 * (bb[0][1] + bb[1][1]),
-        0.5 * (bb[0][2] + bb[1][2]),
-    ]
+    center = bb.mean(axis=0)
 
     # Update the refineLayerMeshDict parameters
     refine_layer_mesh_dict = f"{case_dir}/system/refineLayerMeshDict"
-    update_parameter(
-        refine_layer_mesh_dict,
-        "geometry/refinementBox/min",
-        f"( {bb[0][0]} {bb[0][1]} {bb[0][2]} )",
-    )
-    update_parameter(
-        refine_layer_mesh_dict,
-        "geometry/refinementBox/max",
-        f"( {bb[1][0]} {bb[1][1]} {bb[1][2]} )",
-    )
-    update_parameter(
-        refine_layer_mesh_dict,
-        "castellatedMeshControls/locationInMesh",
-        f"( {center[0]} {center[1]} {center[2]} )",
-    )
-    update_parameter(
+    update_parameters(
         refine_layer_mesh_dict,
-        "castellatedMeshControls/refinementRegions/refinementBox/levels",
-        f"( ({refinement_level} {refinement_level}) )",
+        {
+            "geometry/refinementBox/min": f"( {bb[0][0]} {bb[0][1]} {bb[0][2]} )",
+            "geometry/refinementBox/max": f"( {bb[1][0]} {bb[1][1]} {bb[1][2]} )",
+            "castellatedMeshControls/locationInMesh": (
+                f"( {center[0]} {center[1]} {center[2]} )"
+            ),
+            "castellatedMeshControls/refinementRegions/refinementBox/levels": (
+                f"( ({refinement_level} {refinement_level}) )"
+            ),
+        },
     )
 
     # Run snappyHexMesh and renumber mesh
@@ -11,6 +11,7 @@
 import glob
 import os
 import shutil
+from concurrent.futures import ThreadPoolExecutor
 from myna.core.workflow.load_input import load_input
 from myna.application.openfoam import mesh
 from myna.core.app.base import MynaApp
@@ -68,22 +69,50 @@ class OpenFOAMMeshPartVTK(MynaApp):
         mesh.create_part_mesh(case_dir, working_stl_path, bb_dict, app=self)
         return mesh.foam_to_adamantine(case_dir)
 
+    def mesh_case(self, myna_file, case_dir):
+        """Create the mesh of a case directory and move it to the expected Myna file."""
+        output_file = self.create_mesh(
+            case_dir, self.args.scale, self.args.coarse, self.args.refine
+        )
+        shutil.move(output_file, myna_file)
+        mesh.remove_paths([os.path.join(case_dir, "VTK")])
+
     def execute(self):
-        """Execute all case directories and write expected Myna output files."""
+        """Execute all case directories and write expected Myna output files.
+
+        The cases are independent, so in batch mode they are meshed concurrently, with
+        as many cases at a time as `--maxproc` allows for `--np` processors per case.
+        Cases with an existing Myna file are skipped unless `--overwrite` is set.
+        """
         self.parse_execute_arguments()
         myna_files = self.get_step_output_paths()
 
-        for myna_file, case_dir in zip(
-            myna_files, self.get_case_dirs(output_paths=myna_files)
-        ):
-            output_file = self.create_mesh(
-                case_dir, self.args.scale, self.args.coarse, self.args.refine
+        # Only mesh the cases without existing output, unless overwriting
+        cases = [
+            (myna_file, case_dir)
+            for myna_file, case_dir in zip(
+                myna_files, self.get_case_dirs(output_paths=myna_files)
             )
+            if (not os.path.exists(myna_file)) or (self.args.overwrite)
+        ]
 
-            shutil.move(output_file, myna_file)
-            shutil.rmtree(os.path.join(case_dir, "VTK"), ignore_errors=True)
+        if self.args.batch and len(cases) > 1:
+            # Each case mostly waits on OpenFOAM subprocesses, so threads are enough to
+            # overlap the cases
+            max_workers = max(1, (self.args.maxproc or 1) // self.args.np)
+            with ThreadPoolExecutor(
+                max_workers=min(max_workers, len(cases))
+            ) as executor:
+                futures = [
+                    executor.submit(self.mesh_case, myna_file, case_dir)
+                    for myna_file, case_dir in cases
+                ]
+                for future in futures:
+                    future.result()
+        else:
+            for myna_file, case_dir in cases:
+                self.mesh_case(myna_file, case_dir)
 
-            input_dir = os.path.dirname(self.input_file)
-            obj_files = glob.glob(os.path.join(input_dir, "*.obj"))
-            for obj_file in obj_files:
-                os.remove(obj_file)
+        # Clean up the exported OBJ files once all cases are meshed
+        input_dir = os.path.dirname(self.input_file)
+        mesh.remove_paths(glob.glob(os.path.join(input_dir, "*.obj")))
@@ -17,30 +17,49 @@ class RVEPartCenter(RVE):
         super().__init__()
         self.class_name = "rve_part_center"
 
-    def find_part_central_rve(self, part, layerset, rve_dict, rve_id):
-        """Update the RVE dictionary with a new center point for the given part."""
-        layer = layerset["layer_start"]
-        id_map_file = self.settings["data"]["build"]["layer_data"][f"{layer}"][
-            "part_id_map"
-        ]["file_local"]
-        id_map = pl.scan_parquet(id_map_file).collect()
+    def get_part_bounding_boxes(self, layers):
+        """Return a LazyFrame with the bounding box of each part in each layer.
 
-        part_map = id_map.filter(pl.col("part_id") == part)
-        xmin = part_map["x (m)"].min()
-        ymin = part_map["y (m)"].min()
-        xmax = part_map["x (m)"].max()
-        ymax = part_map["y (m)"].max()
-        xavg = 0.5 * (xmin + xmax)
-        yavg = 0.5 * (ymin + ymax)
-
-        rve_dict_updated = rve_dict.copy()
-        rve_dict_updated["id"].append(rve_id)
-        rve_dict_updated["x (m)"].append(xavg)
-        rve_dict_updated["y (m)"].append(yavg)
-        rve_dict_updated["layer_starts"].append(layerset["layer_start"])
-        rve_dict_updated["layer_ends"].append(layerset["layer_end"])
-        rve_dict_updated["part"].append(part)
-        return rve_dict_updated
+        Each layer's part ID map is scanned once, aggregating the bounds of all parts
+        in the layer. The columns are "layer_starts", "part", "xmin", "xmax", "ymin",
+        and "ymax".
+        """
+        frames = []
+        for layer in layers:
+            id_map_file = self.settings["data"]["build"]["layer_data"][f"{layer}"][
+                "part_id_map"
+            ]["file_local"]
+            frames.append(
+                pl.scan_parquet(id_map_file)
+                .select("part_id", "x (m)", "y (m)")
+                .group_by("part_id")
+                .agg(
+                    pl.col("x (m)").min().alias("xmin"),
+                    pl.col("x (m)").max().alias("xmax"),
+                    pl.col("y (m)").min().alias("ymin"),
+                    pl.col("y (m)").max().alias("ymax"),
+                )
+                .select(
+                    pl.lit(layer, dtype=pl.Int64).alias("layer_starts"),
+                    pl.col("part_id").cast(pl.String).alias("part"),
+                    "xmin",
+                    "xmax",
+                    "ymin",
+                    "ymax",
+                )
+            )
+        if len(frames) == 0:
+            return pl.LazyFrame(
+                schema={
+                    "layer_starts": pl.Int64,
+                    "part": pl.String,
+                    "xmin": pl.Float64,
+                    "xmax": pl.Float64,
+                    "ymin": pl.Float64,
+                    "ymax": pl.Float64,
+                }
+            )
+        return pl.concat(frames)
 
     def execute(self):
         """Execute RVE selection for all output files."""
@@ -50,60 +69,71 @@ class RVEPartCenter(RVE):
             layersets = get_adjacent_layer_regions(
                 self.settings["data"], self.args.max_layers
             )
-            rve_dict = {
-                "id": [],
-                "x (m)": [],
-                "y (m)": [],
-                "layer_starts": [],
-                "layer_ends": [],
-                "part": [],
-            }
-            rve_id = 1
-            for part in layersets.keys():
-                for layerset in layersets[part]:
-                    rve_dict = self.find_part_central_rve(
-                        part, layerset, rve_dict, rve_id
-                    )
-                    rve_id += 1
-
-            export = pl.DataFrame(
-                rve_dict,
-                schema={
-                    "id": int,
-                    "x (m)": float,
-                    "y (m)": float,
-                    "layer_starts": int,
-                    "layer_ends": int,
-                    "part": str,
+            layersets_df = pl.DataFrame(
+                {
+                    "part": [part for part in layersets for _ in layersets[part]],
+                    "layer_starts": [
+                        layerset["layer_start"]
+                        for part in layersets
+                        for layerset in layersets[part]
+                    ],
+                    "layer_ends": [
+                        layerset["layer_end"]
+                        for part in layersets
+                        for layerset in layersets[part]
+                    ],
                 },
+                schema={"part": pl.String, "layer_starts": int, "layer_ends": int},
             )
-            export.write_csv(myna_file)
+
+            # Place each RVE at the center of its part's bounding box in the
+            # starting layer, numbering the RVEs in layer set order
+            bbox = self.get_part_bounding_boxes(
+                layersets_df["layer_starts"].unique().sort()
+            )
+            export_lf = (
+                layersets_df.lazy()
+                .with_row_index("id", offset=1)
+                .join(bbox, on=["layer_starts", "part"], how="left")
+                .sort("id")
+                .select(
+                    pl.col("id").cast(pl.Int64),
+                    ((pl.col("xmin") + pl.col("xmax")) * 0.5).alias("x (m)"),
+                    ((pl.col("ymin") + pl.col("ymax")) * 0.5).alias("y (m)"),
+                    "layer_starts",
+                    "layer_ends",
+                    "part",
+                )
+            )
+            if hasattr(export_lf, "sink_csv"):
+                export_lf.sink_csv(myna_file)
+            else:
+                export_lf.collect().write_csv(myna_file)
 
     def postprocess(self):
         """Populate region metadata from the selected RVEs."""
         self.parse_postprocess_arguments()
         myna_files = self.settings["data"]["output_paths"][self.step_name]
-        for part in self.settings["data"]["build"]["parts"]:
-            values = self.settings["data"]["build"]["parts"][part].get("regions")
-            if values is None:
-                self.settings["data"]["build"]["parts"][part]["regions"] = {}
+        parts = self.settings["data"]["build"]["parts"]
+        for part_settings in parts.values():
+            if part_settings.get("regions") is None:
+                part_settings["regions"] = {}
 
         for myna_file in myna_files:
-            df = pl.read_csv(myna_file)
+            df = pl.read_csv(myna_file).with_columns(
+                pl.int_ranges(pl.col("layer_starts"), pl.col("layer_ends") + 1).alias(
+                    "layers"
+                )
+            )
             for row in df.iter_rows(named=True):
                 part = str(row["part"])
                 region = f"rve_{row['id']}"
-                self.settings["data"]["build"]["parts"][part]["regions"][region] = {
+                parts[part]["regions"][region] = {
                     "x": row["x (m)"],
                     "y": row["y (m)"],
                     "layer_starts": row["layer_starts"],
                     "layer_ends": row["layer_ends"],
-                    "layers": [
-                        x
-                        for x in range(
-                            int(row["layer_starts"]), int(row["layer_ends"]) + 1
-                        )
-                    ],
+                    "layers": row["layers"],
                 }
 
         write_input(self.settings, self.input_file)
@@ -14,6 +14,7 @@ import matplotlib as mpl
 import matplotlib.pyplot as plt
 import numpy as np
 import pandas as pd
+import polars as pl
 import skimage
 from matplotlib.collections import PatchCollection
 from matplotlib.patches import Rectangle
@@ -46,10 +47,6 @@ class RVESelection(RVE):
         )
         self.parse_known_args()
 
-    def parse_postprocess_arguments(self):
-        self.parse_shared_arguments()
-        self.parse_known_args()
-
     @staticmethod
     def cluster_colormap(n_digits, colorspace="tab20"):
         colors = mpl.cm.get_cmap(colorspace, n_digits)
@@ -346,34 +343,36 @@ class RVESelection(RVE):
         self.parse_postprocess_arguments()
         myna_files = self.settings["data"]["output_paths"][self.step_name]
 
-        for part in self.settings["data"]["build"]["parts"]:
-            values = self.settings["data"]["build"]["parts"][part].get("regions")
-            if values is None:
-                self.settings["data"]["build"]["parts"][part]["regions"] = {}
+        parts = self.settings["data"]["build"]["parts"]
+        for part_settings in parts.values():
+            if part_settings.get("regions") is None:
+                part_settings["regions"] = {}
 
         for myna_file in myna_files:
-            df = pd.read_csv(
+            df = pl.read_csv(
                 myna_file,
-                dtype={
-                    "id": np.int64,
-                    "x (m)": np.float64,
-                    "y (m)": np.float64,
-                    "layer_starts": np.int64,
-                    "layer_ends": np.int64,
-                    "part": "string",
+                schema_overrides={
+                    "id": pl.Int64,
+                    "x (m)": pl.Float64,
+                    "y (m)": pl.Float64,
+                    "layer_starts": pl.Int64,
+                    "layer_ends": pl.Int64,
+                    "part": pl.String,
                 },
+            ).with_columns(
+                pl.int_ranges(pl.col("layer_starts"), pl.col("layer_ends") + 1).alias(
+                    "layers"
+                )
             )
-            for row in df.to_dict(orient="records"):
+            for row in df.iter_rows(named=True):
                 part = str(row["part"])
                 region = f"rve_{row['id']}"
-                layer_start = int(row["layer_starts"])
-                layer_end = int(row["layer_ends"])
-                self.settings["data"]["build"]["parts"][part]["regions"][region] = {
+                parts[part]["regions"][region] = {
                     "x": row["x (m)"],
                     "y": row["y (m)"],
-                    "layer_starts": layer_start,
-                    "layer_ends": layer_end,
-                    "layers": [x for x in range(layer_start, layer_end + 1)],
+                    "layer_starts": row["layer_starts"],
+                    "layer_ends": row["layer_ends"],
+                    "layers": row["layers"],
                 }
 
         write_input(self.settings, self.input_file)
@@ -11,6 +11,7 @@ from .parse import (
     load_file_lines,
     find_keyword_line_indices,
     adjust_parameter,
+    adjust_parameters,
     read_parameter,
     copy_simulation_result,
     update_domain_resolution,
@@ -22,6 +23,7 @@ __all__ = [
     "load_file_lines",
     "find_keyword_line_indices",
     "adjust_parameter",
+    "adjust_parameters",
     "read_parameter",
     "copy_simulation_result",
     "Thesis",
@@ -97,21 +97,21 @@ class ThesisDepthMapPart(Thesis):
                     f"{case_directory} with pattern {result_file_pattern}"
                 )
                 continue
-            df_all = pl.DataFrame(
-                schema={
-                    "x (m)": pl.Float64,
-                    "y (m)": pl.Float64,
-                    "depth (m)": pl.Float64,
-                }
-            )
+            # Keep the top z-plane of each result file, scanning the files lazily so
+            # that Polars reads and filters them in parallel
+            frames = []
             for i, filepath in enumerate(output_files):
                 print(i, ":", filepath)
-                df = pl.read_csv(filepath)
-                df = df.filter(pl.col("z") == df["z"].max())
-                df = df.rename({"x": "x (m)", "y": "y (m)", "depth": "depth (m)"})
-                df = df.select(["x (m)", "y (m)", "depth (m)"])
-                df = df.cast(df_all.schema)
-                df_all = pl.concat([df_all, df])
+                frames.append(
+                    pl.scan_csv(filepath)
+                    .filter(pl.col("z") == pl.col("z").max())
+                    .select(
+                        pl.col("x").cast(pl.Float64).alias("x (m)"),
+                        pl.col("y").cast(pl.Float64).alias("y (m)"),
+                        pl.col("depth").cast(pl.Float64).alias("depth (m)"),
+                    )
+                )
+            df_all = pl.concat(frames).collect()
             df_all.write_csv(mynafile)
 
     def _depth_map_result_pattern(self, case_directory):
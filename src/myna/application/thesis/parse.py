@@ -41,14 +41,26 @@ def adjust_parameter(filepath, keyword, value):
     keyword -- keyword value to update in specified file
     value -- value to update keyword to
     """
+    adjust_parameters(filepath, {keyword: value})
+
+
+def adjust_parameters(filepath, parameters):
+    """Updates several keyword values for 3DThesis input file, reading and writing
+    the file only once
+
+    Keyword arguments:
+    filepath -- filepath for the 3DThesis file to update
+    parameters -- dictionary of {keyword: value} pairs to update, applied in order
+    """
 
     file_lines = load_file_lines(filepath)
-    kwrd_line_indices = find_keyword_line_indices(file_lines, keyword, filepath)
+    for keyword, value in parameters.items():
+        kwrd_line_indices = find_keyword_line_indices(file_lines, keyword, filepath)
 
-    # Update the value for the keyword entry
-    updated_line = f"\t{keyword}\t{value}"
-    for i in kwrd_line_indices:
-        file_lines[i] = updated_line
+        # Update the value for the keyword entry
+        updated_line = f"\t{keyword}\t{value}"
+        for i in kwrd_line_indices:
+            file_lines[i] = updated_line
 
     # Write file out
     with open(filepath, "w") as f:
@@ -20,15 +20,24 @@ class Path:
         self.end = self.data["time"].max()
         pass
 
+    def setArrays(self):
+        # NumPy views of the columns used to look up path locations
+        self._time = self.data["time"].to_numpy()
+        self._mode = self.data["Mode"].to_numpy()
+        self._t_param = self.data["tParam"].to_numpy()
+        self._xs = self.data["xs"].to_numpy()
+        self._xe = self.data["xe"].to_numpy()
+        self._ys = self.data["ys"].to_numpy()
+        self._ye = self.data["ye"].to_numpy()
+        pass
+
     def getIndex(self, time):
-        pathIndex = 0
         n = self.size - 1
         if time <= self.end:
-            while (pathIndex < n) and (self.data.at[pathIndex, "time"] < time):
-                pathIndex += 1
-            if (self.data.at[pathIndex, "Mode"] == 1) and (
-                self.data.at[pathIndex, "tParam"] == 0
-            ):
+            # The times are cumulative, so the first command ending at or after the
+            # given time is found by binary search
+            pathIndex = min(int(np.searchsorted(self._time, time, side="left")), n)
+            if (self._mode[pathIndex] == 1) and (self._t_param[pathIndex] == 0):
                 pathIndex = min(pathIndex + 1, n)
         else:
             pathIndex = n
@@ -38,22 +47,24 @@ class Path:
         # to-do: fix behavior for last time in scan path
         i = self.getIndex(time)
         if time <= self.end:
-            dx = self.data.at[i, "xe"] - self.data.at[i, "xs"]
-            dy = self.data.at[i, "ye"] - self.data.at[i, "ys"]
-            dt = self.data.at[i, "time"] - self.data.at[i - 1, "time"]
+            dx = self._xe[i] - self._xs[i]
+            dy = self._ye[i] - self._ys[i]
+            # The first command starts at the beginning of the scan path
+            t_start = self._time[i - 1] if i > 0 else 0.0
+            dt = self._time[i] - t_start
             if dt > 0:
-                tFrac = (time - self.data.at[i - 1, "time"]) / dt
+                tFrac = (time - t_start) / dt
                 dist = [tFrac * dx, tFrac * dy]
             else:
                 dist = [0, 0]
             laserCenter = [
-                self.data.at[i, "xs"] + dist[0],
-                self.data.at[i, "ys"] + dist[1],
+                self._xs[i] + dist[0],
+                self._ys[i] + dist[1],
             ]
         else:
             laserCenter = [
-                self.data.at[self.size - 1, "xs"],
-                self.data.at[self.size - 1, "ys"],
+                self._xs[self.size - 1],
+                self._ys[self.size - 1],
             ]
         return [laserCenter, i]
 
@@ -70,56 +81,38 @@ class Path:
             self.data = pd.read_csv(loadIfExists)
             self.setSize()
             self.setEnd()
+            self.setArrays()
         else:
             self.data = pd.read_csv(file, sep=r"\s+")
             self.setSize()
-            self.data["time"] = 0.0
-
-            # Load columns from scan path (might have to update righthand side names)
-            self.data["xs"] = self.data[xName].to_numpy()
-            self.data["xe"] = self.data[xName].to_numpy()
-            self.data["ys"] = self.data[yName].to_numpy()
-            self.data["ye"] = self.data[yName].to_numpy()
-            self.data["tParam"] = self.data[timeName].to_numpy()
-
-            # Calculate time and distance for each point in the scan path
-            for index in range(self.size):
-                if self.data.at[index, "Mode"] == 1:
-                    if index == 0:
-                        self.data.at[index, "time"] = self.data.at[index, "tParam"]
-                    else:
-                        self.data.at[index, "time"] = (
-                            self.data.at[index - 1, "time"]
-                            + self.data.at[index, "tParam"]
-                        )
-                    self.data.at[index, "xs"] = self.data.at[index, xName]
-                    self.data.at[index, "xe"] = self.data.at[index, xName]
-                    self.data.at[index, "ys"] = self.data.at[index, yName]
-                    self.data.at[index, "ye"] = self.data.at[index, yName]
-                else:
-                    if index == 0:
-                        assumed_origin = [0.0, 0.0]
-                        dx = self.data.at[index, xName] - assumed_origin[0]
-                        dy = self.data.at[index, yName] - assumed_origin[1]
-                        ts = 0.0
-                        xs = assumed_origin[0]
-                        ys = assumed_origin[1]
-                    else:
-                        dx = self.data.at[index, xName] - self.data.at[index - 1, xName]
-                        dy = self.data.at[index, yName] - self.data.at[index - 1, yName]
-                        ts = self.data.at[index - 1, "time"]
-                        xs = self.data.at[index - 1, "xe"]
-                        ys = self.data.at[index - 1, "ye"]
-                    distance = np.sqrt(np.power(dx, 2) + np.power(dy, 2))
-                    # Distance in mm, tParam (velocity) in m/s, time in s
-                    self.data.at[index, "time"] = ts + distance / (
-                        self.data.at[index, "tParam"] * 1e3
-                    )
-                    self.data.at[index, "xs"] = xs
-                    self.data.at[index, "xe"] = self.data.at[index, xName]
-                    self.data.at[index, "ys"] = ys
-                    self.data.at[index, "ye"] = self.data.at[index, yName]
+
+            # Calculate time and distance for each point in the scan path. Spot
+            # commands (Mode 1) stay at their point for tParam seconds, while line
+            # commands (Mode 0) travel from the previous point (or the origin, for the
+            # first command) at a velocity of tParam
+            x = self.data[xName].to_numpy()
+            y = self.data[yName].to_numpy()
+            t_param = self.data[timeName].to_numpy()
+            is_spot = self.data["Mode"].to_numpy() == 1
+            x_prev = np.zeros(self.size)
+            x_prev[1:] = x[:-1]
+            y_prev = np.zeros(self.size)
+            y_prev[1:] = y[:-1]
+            distance = np.sqrt(np.power(x - x_prev, 2) + np.power(y - y_prev, 2))
+
+            # Distance in mm, tParam (velocity) in m/s, time in s
+            increments = t_param.astype(float)
+            is_line = ~is_spot
+            increments[is_line] = distance[is_line] / (t_param[is_line] * 1e3)
+
+            self.data["time"] = np.cumsum(increments)
+            self.data["xs"] = np.where(is_spot, x, x_prev)
+            self.data["xe"] = x
+            self.data["ys"] = np.where(is_spot, y, y_prev)
+            self.data["ye"] = y
+            self.data["tParam"] = t_param
             self.setEnd()
+            self.setArrays()
             if loadIfExists is not None and saveFile:
                 self.data.to_csv(loadIfExists, index=False)
 
@@ -146,12 +139,9 @@ class Path:
         elapsed_time = self.data["time"].max()
 
         # Total path distance, in millimeters
-        self.data["path distance"] = np.power(
-            np.power(self.data["xe"] - self.data["xs"], 2)
-            + np.power(self.data["ye"] - self.data["ys"], 2),
-            0.5,
-        )
-        linear_distance = self.data["path distance"].sum()
+        dx = self.data["xe"].to_numpy() - self.data["xs"].to_numpy()
+        dy = self.data["ye"].to_numpy() - self.data["ys"].to_numpy()
+        linear_distance = np.hypot(dx, dy).sum()
         return [float(elapsed_time), float(linear_distance)]
 
     def _get_spot_offtime(self, row_index) -> float | None:
@@ -184,3 +174,10 @@ class Path:
     data = None
     size = None
     end = None
+    _time = None
+    _mode = None
+    _t_param = None
+    _xs = None
+    _xe = None
+    _ys = None
+    _ye = None
@@ -15,7 +15,7 @@ import subprocess
 import mistlib as mist
 import pandas as pd
 
-from myna.application.thesis.parse import adjust_parameter
+from myna.application.thesis.parse import adjust_parameter, adjust_parameters
 from myna.core.app.base import MynaApp
 from myna.core.utils import working_directory
 from myna.core.workflow.load_input import load_input
@@ -89,11 +89,10 @@ class Thesis(MynaApp):
         spot_scale = self._spot_size_scale(spot_unit)
         beam_width = 0.25 * math.sqrt(6) * spot_size * spot_scale
 
-        adjust_parameter(beam_file, "Width_X", beam_width)
-        adjust_parameter(beam_file, "Width_Y", beam_width)
-        adjust_parameter(beam_file, "Power", power)
+        beam_parameters = {"Width_X": beam_width, "Width_Y": beam_width, "Power": power}
         if laser_absorption is not None:
-            adjust_parameter(beam_file, "Efficiency", laser_absorption)
+            beam_parameters["Efficiency"] = laser_absorption
+        adjust_parameters(beam_file, beam_parameters)
 
     def _configure_case_material_and_domain(self, case_dir, settings):
         """Apply shared material, preheat, and domain settings for a case."""
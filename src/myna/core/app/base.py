@@ -472,12 +472,15 @@ class MynaApp:
             self.args.maxproc = min(os_cpus, self.args.maxproc)
             self.args.np = min(self.args.np, self.args.maxproc)
 
-    def copy_template_to_case(self, case_dir):
+    def copy_template_to_case(self, case_dir, copy_function=shutil.copy2):
         """Copies the set template directory to a case directory, with existing files
         being overwritten depending on the app overwrite user setting.
 
         Args:
         - case_dir: (str) path to the case directory
+        - copy_function: (callable) function used by `shutil.copytree` to copy each
+          template file, e.g., `myna.core.utils.link_or_copy` to hard link template
+          files that are not modified in the case directory
         """
 
         # Do not copy anything if no template is set
@@ -501,7 +504,12 @@ class MynaApp:
 
         # Copy if there are no existing files in the case directory or overwrite is specified
         if (len(case_dir_files) == 0) or (self.args.overwrite):
-            shutil.copytree(self.template, case_dir, dirs_exist_ok=True)
+            shutil.copytree(
+                self.template,
+                case_dir,
+                dirs_exist_ok=True,
+                copy_function=copy_function,
+            )
         else:
             print(f"Warning: NOT overwriting existing case in: {case_dir}")
 
@@ -10,7 +10,7 @@
 
 from .conversion import str_to_list, get_quoted_str
 from .downsample_to_image import downsample_to_image
-from .filesystem import working_directory, is_executable, strf_datetime
+from .filesystem import working_directory, is_executable, link_or_copy, strf_datetime
 from .get_adjacent_layers import get_adjacent_layer_regions
 from .get_argparse_defaults import get_script_call_with_defaults
 from .nested_dict_tools import nested_set, nested_get, get_synonymous_key
@@ -21,6 +21,7 @@ __all__ = [
     "downsample_to_image",
     "working_directory",
     "is_executable",
+    "link_or_copy",
     "strf_datetime",
     "get_adjacent_layer_regions",
     "get_script_call_with_defaults",
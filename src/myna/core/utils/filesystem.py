@@ -34,6 +34,24 @@ def is_executable(executable):
         return False
 
 
+def link_or_copy(src, dst):
+    """Hard links a file to the destination, falling back to a copy if a link cannot
+    be created (e.g., across devices). An existing destination file is removed first,
+    so that a previously linked file is never overwritten in place.
+
+    Intended for use as the `copy_function` of `shutil.copytree` for template files
+    that are read but not modified in the destination directory. Modified files must
+    be written to a new file, e.g., with `os.replace`, to avoid updating the source.
+    """
+    if os.path.lexists(dst):
+        os.unlink(dst)
+    try:
+        os.link(src, dst)
+    except OSError:
+        shutil.copy2(src, dst)
+    return dst
+
+
 def strf_datetime(datetime_obj):
     """Return the current date and time as a pretty string"""
     return datetime_obj.strftime("%Y-%m-%d %H:%M:%S")
@@ -0,0 +1,44 @@
+#
+# Copyright (c) Oak Ridge National Laboratory.
+#
+# This file is part of Myna. For details, see the top-level license
+# at https://github.com/ORNL-MDF/Myna/LICENSE.md.
+#
+# License: 3-clause BSD, see https://opensource.org/licenses/BSD-3-Clause.
+#
+import os
+from types import SimpleNamespace
+
+from myna.application.deer.creep_timeseries_region import CreepTimeseriesRegionDeerApp
+
+
+def test_configure_case_reconfigures_when_load_changes(monkeypatch, tmp_path):
+    template_dir = tmp_path / "template"
+    template_dir.mkdir()
+    exodus_file = tmp_path / "mesh.e"
+    case_dir = tmp_path / "case"
+    case_dir.mkdir()
+    for path in [template_dir / "case.i", exodus_file]:
+        path.write_text("", encoding="utf-8")
+        os.utime(path, (0, 0))
+
+    app = object.__new__(CreepTimeseriesRegionDeerApp)
+    app.configured_stamp_name = ".myna_configured"
+    app.args = SimpleNamespace(
+        overwrite=False, template=str(template_dir), load=100.0, loaddir="z"
+    )
+    configured = []
+    monkeypatch.setattr(app, "copy_template_to_case", lambda *args, **kwargs: None)
+    monkeypatch.setattr(app, "generate_orientation_file", lambda *args: None)
+    monkeypatch.setattr(
+        app,
+        "update_case_loading_parameters",
+        lambda case_dir, exodus_file: configured.append(app.args.load),
+    )
+
+    app.configure_case(str(case_dir), str(exodus_file))
+    app.configure_case(str(case_dir), str(exodus_file))
+    app.args.load = 200.0
+    app.configure_case(str(case_dir), str(exodus_file))
+
+    assert configured == [100.0, 200.0]
@@ -19,6 +19,9 @@ from myna.application.exaca.microstructure_region import ExaCAMicrostructureRegi
 from myna.application.exaca.microstructure_region_slice import (
     ExaCAMicrostructureRegionSlice,
 )
+import myna.application.exaca.exaca as exaca_module
+from myna.application.exaca.exaca import load_case_inputs
+import myna.application.exaca.microstructure_region.app as region_app_module
 import myna.application.exaca.microstructure_region_slice.app as slice_app_module
 import myna.core.context as context_module
 
@@ -360,6 +363,19 @@ def test_convert_case_input_preserves_pre_21_substrate_settings(monkeypatch, tmp
     assert converted == input_settings
 
 
+def test_convert_case_input_skips_write_without_deprecated_settings(
+    monkeypatch, tmp_path
+):
+    app = ExaCAMicrostructureRegion()
+    monkeypatch.setattr(app, "get_executable_version", lambda: "2.1.0")
+    input_settings = {"Substrate": {"MeanBaseplateGrainSize": 12.3}}
+
+    converted = app.convert_case_input_for_exaca_version(str(tmp_path), input_settings)
+
+    assert converted == {"Substrate": {"MeanBaseplateGrainSize": 12.3}}
+    assert not (tmp_path / "inputs.json").exists()
+
+
 def test_region_execute_moves_exaca_vtk_to_workflow_output(monkeypatch, tmp_path):
     monkeypatch.setattr(context_module, "_LEGACY_ENV_FALLBACK_WARNED", False)
     _configure_minimal_app_env(monkeypatch, tmp_path)
@@ -407,6 +423,12 @@ def test_slice_execute_writes_csv_statistics_from_raw_vtk(monkeypatch, tmp_path)
     )
 
     class FakeStructuredPoints:
+        def GetDimensions(self):
+            return (2, 2, 3)
+
+        def GetOrigin(self):
+            return (0.0, 0.0, 0.0)
+
         def GetSpacing(self):
             return (2.0, 2.0, 2.0)
 
@@ -414,6 +436,7 @@ def test_slice_execute_writes_csv_statistics_from_raw_vtk(monkeypatch, tmp_path)
         def GetOutput(self):
             return FakeStructuredPoints()
 
+    # Z-plane index of each point, with the middle plane (index 1) selected
     df = pd.DataFrame(
         {
             "X (m)": [0.0, 1.0, 2.0, 3.0],
@@ -439,7 +462,9 @@ def test_slice_execute_writes_csv_statistics_from_raw_vtk(monkeypatch, tmp_path)
         slice_app_module, "grain_id_reader", lambda filepath: FakeReader()
     )
     monkeypatch.setattr(
-        slice_app_module, "convert_id_to_rotation", lambda reader, ref_file: df
+        slice_app_module,
+        "convert_id_to_rotation",
+        lambda reader, ref_file, z_index: df[df["Z (m)"] == z_index],
     )
     monkeypatch.setattr(
         slice_app_module, "get_mean_grain_area", lambda df, spacing: 9.5
@@ -485,7 +510,7 @@ def test_slice_postprocess_colors_raw_exaca_vtk(monkeypatch, tmp_path):
         app, "get_output_file_status", lambda: ([str(workflow_output)], [True], [True])
     )
     monkeypatch.setattr(
-        slice_app_module,
+        region_app_module,
         "add_rgb_to_vtk",
         lambda in_file, out_file, ref_file: calls.update(
             {"in_file": in_file, "out_file": out_file, "ref_file": ref_file}
@@ -501,3 +526,170 @@ def test_slice_postprocess_colors_raw_exaca_vtk(monkeypatch, tmp_path):
         str(case_dir / "output" / "exaca_rgb.vtk")
     )
     assert calls["ref_file"] == "orientations.csv"
+
+
+def test_region_export_rgb_vtks_uses_process_pool_in_batch_mode(monkeypatch, tmp_path):
+    monkeypatch.setattr(context_module, "_LEGACY_ENV_FALLBACK_WARNED", False)
+    _configure_minimal_app_env(monkeypatch, tmp_path)
+    with pytest.warns(DeprecationWarning, match="Myna 2.0"):
+        app = ExaCAMicrostructureRegion()
+
+    pools = []
+
+    class FakeExecutor:
+        def __init__(self, max_workers):
+            pools.append(max_workers)
+
+        def __enter__(self):
+            return self
+
+        def __exit__(self, *args):
+            return False
+
+        def map(self, fn, *iterables):
+            return map(fn, *iterables)
+
+    calls = []
+    monkeypatch.setattr(region_app_module, "ProcessPoolExecutor", FakeExecutor)
+    monkeypatch.setattr(
+        region_app_module,
+        "add_rgb_to_vtk",
+        lambda in_file, out_file, ref_file: calls.append((in_file, out_file, ref_file)),
+    )
+    tasks = [
+        ("a.vtk", "a_rgb.vtk", "orientations.csv"),
+        ("b.vtk", "b_rgb.vtk", "orientations.csv"),
+    ]
+
+    app.args = SimpleNamespace(batch=False, maxproc=8)
+    app._export_rgb_vtks(tasks)
+    assert pools == []
+    assert calls == tasks
+
+    calls.clear()
+    app.args = SimpleNamespace(batch=True, maxproc=8)
+    app._export_rgb_vtks(tasks)
+    assert pools == [2]
+    assert calls == tasks
+
+
+def test_slice_finalize_case_outputs_uses_process_pool_in_batch_mode(
+    monkeypatch, tmp_path
+):
+    monkeypatch.setattr(context_module, "_LEGACY_ENV_FALLBACK_WARNED", False)
+    _configure_minimal_app_env(monkeypatch, tmp_path)
+    with pytest.warns(DeprecationWarning, match="Myna 2.0"):
+        app = ExaCAMicrostructureRegionSlice()
+
+    submitted = []
+
+    class FakeFuture:
+        def __init__(self, value):
+            self.value = value
+
+        def result(self):
+            return self.value
+
+    class FakeExecutor:
+        def __init__(self, max_workers):
+            self.max_workers = max_workers
+
+        def __enter__(self):
+            return self
+
+        def __exit__(self, *args):
+            return False
+
+        def submit(self, fn, *args):
+            submitted.append((self.max_workers, args))
+            return FakeFuture(fn(*args))
+
+    calls = []
+    monkeypatch.setattr(slice_app_module, "ProcessPoolExecutor", FakeExecutor)
+    monkeypatch.setattr(
+        slice_app_module,
+        "write_slice_statistics",
+        lambda filepath, myna_file: calls.append((filepath, myna_file)),
+    )
+    case_outputs = [("a/exaca.vtk", "a/slice.csv"), ("b/exaca.vtk", "b/slice.csv")]
+    app.args = SimpleNamespace(batch=True, maxproc=4)
+    app._finalize_case_outputs(case_outputs)
+
+    assert calls == case_outputs
+    assert submitted == [(2, case_outputs[0]), (2, case_outputs[1])]
+
+
+def test_region_run_case_makes_script_executable_without_subprocess(
+    monkeypatch, tmp_path
+):
+    monkeypatch.setattr(context_module, "_LEGACY_ENV_FALLBACK_WARNED", False)
+    _configure_minimal_app_env(monkeypatch, tmp_path)
+    with pytest.warns(DeprecationWarning, match="Myna 2.0"):
+        app = ExaCAMicrostructureRegion()
+    app.args = SimpleNamespace(np=4)
+
+    case_dir = tmp_path / "case"
+    case_dir.mkdir()
+    run_script = case_dir / "runCase.sh"
+    run_script.write_text("mpiexec -n {{RANKS}} ExaCA inputs.json\n", encoding="utf-8")
+    run_script.chmod(0o644)
+
+    started = []
+    monkeypatch.setattr(
+        app, "start_subprocess", lambda cmd_args: started.append(cmd_args) or "proc"
+    )
+
+    result_file, process = app.run_case(str(case_dir))
+
+    assert started == [[str(run_script)]]
+    assert process == "proc"
+    assert result_file == str(case_dir / "exaca.vtk")
+    assert os.access(run_script, os.X_OK)
+    assert run_script.read_text(encoding="utf-8") == "mpiexec -n 4 ExaCA inputs.json\n"
+
+
+def test_load_case_inputs_caches_until_file_changes(tmp_path):
+    input_file = tmp_path / "inputs.json"
+    input_file.write_text(
+        json.dumps({"GrainOrientationFile": "first.csv"}), encoding="utf-8"
+    )
+
+    hits = exaca_module._read_case_inputs.cache_info().hits
+    first = load_case_inputs(str(tmp_path))
+    first["GrainOrientationFile"] = "modified.csv"
+    second = load_case_inputs(str(tmp_path))
+    # The file is only parsed once, but each caller gets its own copy
+    assert exaca_module._read_case_inputs.cache_info().hits == hits + 1
+    assert second is not first
+    assert second["GrainOrientationFile"] == "first.csv"
+
+    input_file.write_text(
+        json.dumps({"GrainOrientationFile": "second_file.csv"}), encoding="utf-8"
+    )
+    assert load_case_inputs(str(tmp_path))["GrainOrientationFile"] == "second_file.csv"
+
+
+def test_executable_lookup_is_cached_across_cases(monkeypatch, tmp_path):
+    monkeypatch.setattr(context_module, "_LEGACY_ENV_FALLBACK_WARNED", False)
+    _configure_minimal_app_env(monkeypatch, tmp_path)
+    with pytest.warns(DeprecationWarning, match="Myna 2.0"):
+        app = ExaCAMicrostructureRegion()
+
+    lookups = []
+
+    def fake_which(name):
+        lookups.append(name)
+        return f"/opt/{name}/bin/{name}"
+
+    monkeypatch.setattr(exaca_module.shutil, "which", fake_which)
+    app.args = SimpleNamespace(exec="ExaCA")
+    orientation_file = os.path.join(
+        "/opt/ExaCA", "share", "ExaCA", "GrainOrientationVectors.csv"
+    )
+    assert app._get_orientation_file() == orientation_file
+    assert app._get_orientation_file() == orientation_file
+    assert lookups == ["ExaCA"]
+
+    app.args = SimpleNamespace(exec="ExaCA-dev")
+    assert app._get_executable_path() == "/opt/ExaCA-dev/bin/ExaCA-dev"
+    assert lookups == ["ExaCA", "ExaCA-dev"]
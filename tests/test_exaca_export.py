@@ -0,0 +1,60 @@
+#
+# Copyright (c) Oak Ridge National Laboratory.
+#
+# This file is part of Myna. For details, see the top-level license
+# at https://github.com/ORNL-MDF/Myna/LICENSE.md.
+#
+# License: 3-clause BSD, see https://opensource.org/licenses/BSD-3-Clause.
+#
+import numpy as np
+import pytest
+
+from myna.application.exaca.export import get_pole_locations
+
+
+def test_pole_locations_project_cubic_family_to_upper_hemisphere():
+    angle = np.radians(90.0)
+    rotation_about_x = np.array(
+        [
+            [1.0, 0.0, 0.0],
+            [0.0, np.cos(angle), -np.sin(angle)],
+            [0.0, np.sin(angle), np.cos(angle)],
+        ]
+    )
+    M = np.array([np.eye(3), rotation_about_x])
+
+    pole_data = get_pole_locations(M, [1, 0, 0])
+
+    # Six <100> directions per orientation, with antipodal poles projected together
+    assert pole_data.shape == (12, 2)
+    assert np.all(np.linalg.norm(pole_data, axis=1) <= 1.0 + 1e-12)
+    expected = {(-1.0, 0.0), (0.0, -1.0), (0.0, 0.0), (0.0, 1.0), (1.0, 0.0)}
+    assert {tuple(xy) for xy in np.round(pole_data, 8) + 0.0} <= expected
+    np.testing.assert_allclose(
+        np.sort(np.linalg.norm(pole_data, axis=1)), [0.0] * 4 + [1.0] * 8, atol=1e-12
+    )
+
+
+def _sorted_rows(xy):
+    keys = np.round(xy, 6) + 0.0
+    return xy[np.lexsort((keys[:, 1], keys[:, 0]))]
+
+
+@pytest.mark.parametrize("direction", [[1, 0, 0], [1, 1, 0], [1, 1, 1]])
+def test_pole_locations_match_pyebsd_plot_pf(direction):
+    pytest.importorskip("pyebsd")
+    import matplotlib.pyplot as plt
+    from pyebsd.ebsd import plot_PF
+    from scipy.spatial.transform import Rotation
+
+    M = Rotation.random(20, random_state=0).as_matrix()
+    _, ax = plt.subplots()
+    plot_PF(M=M, proj=direction, ax=ax, contour=False, verbose=False, color="k")
+    expected = ax.lines[0].get_xydata()
+    plt.close(ax.figure)
+
+    np.testing.assert_allclose(
+        _sorted_rows(get_pole_locations(M, direction)),
+        _sorted_rows(expected),
+        atol=1e-8,
+    )
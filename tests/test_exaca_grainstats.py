@@ -0,0 +1,66 @@
+#
+# Copyright (c) Oak Ridge National Laboratory.
+#
+# This file is part of Myna. For details, see the top-level license
+# at https://github.com/ORNL-MDF/Myna/LICENSE.md.
+#
+# License: 3-clause BSD, see https://opensource.org/licenses/BSD-3-Clause.
+#
+import numpy as np
+import pandas as pd
+
+from myna.application.exaca.grainstats import (
+    get_misorientation_z,
+    get_misorientation_z_ref,
+)
+
+
+def _write_orientation_file(tmp_path, rotation_matrices):
+    orientation_file = tmp_path / "GrainOrientationVectors.csv"
+    lines = [str(len(rotation_matrices))]
+    lines.extend(",".join(str(x) for x in np.ravel(R)) for R in rotation_matrices)
+    orientation_file.write_text("\n".join(lines) + "\n", encoding="utf-8")
+    return orientation_file
+
+
+def _rotation_about_x(angle_degrees):
+    c = np.cos(np.radians(angle_degrees))
+    s = np.sin(np.radians(angle_degrees))
+    return np.array([[1.0, 0.0, 0.0], [0.0, c, -s], [0.0, s, c]])
+
+
+def test_misorientation_z_ref_uses_nearest_100_direction(tmp_path):
+    rotation_matrices = [
+        np.eye(3),
+        _rotation_about_x(30.0),
+        _rotation_about_x(45.0),
+        _rotation_about_x(60.0),
+        np.array([[0.0, 0.0, 1.0], [1.0, 0.0, 0.0], [0.0, 1.0, 0.0]]),
+    ]
+    orientation_file = _write_orientation_file(tmp_path, rotation_matrices)
+
+    misorientation_z_ref = get_misorientation_z_ref(orientation_file)
+
+    np.testing.assert_allclose(
+        misorientation_z_ref, [0.0, 30.0, 45.0, 30.0, 0.0], atol=1e-6
+    )
+
+
+def test_misorientation_z_maps_grain_ids_to_reference_orientations():
+    misorientation_z_ref = np.array([0.0, 10.0, 20.0])
+    df = pd.DataFrame({"Grain ID": [1, 2, 3, 4, -5, -6]})
+
+    misorientation_z = get_misorientation_z(df, misorientation_z_ref)
+
+    np.testing.assert_allclose(misorientation_z, [0.0, 10.0, 20.0, 0.0, 10.0, 20.0])
+
+
+def test_misorientation_z_ref_is_cached_by_file(tmp_path):
+    orientation_file = _write_orientation_file(tmp_path, [np.eye(3)])
+
+    first = get_misorientation_z_ref(orientation_file)
+    second = get_misorientation_z_ref(orientation_file)
+
+    assert first is second
+    assert first.dtype == np.float32
+    assert not first.flags.writeable
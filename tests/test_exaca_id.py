@@ -0,0 +1,125 @@
+#
+# Copyright (c) Oak Ridge National Laboratory.
+#
+# This file is part of Myna. For details, see the top-level license
+# at https://github.com/ORNL-MDF/Myna/LICENSE.md.
+#
+# License: 3-clause BSD, see https://opensource.org/licenses/BSD-3-Clause.
+#
+import numpy as np
+import pandas as pd
+
+from myna.application.exaca.id import rotation_matrix_to_euler
+from myna.application.exaca.subgrain import rotate_grains
+
+
+def _bunge_rotation_matrix(phi1, Phi, phi2):
+    """Passive (sample -> crystal) rotation matrix for Bunge ZXZ Euler angles"""
+    c1, s1 = np.cos(phi1), np.sin(phi1)
+    c, s = np.cos(Phi), np.sin(Phi)
+    c2, s2 = np.cos(phi2), np.sin(phi2)
+    return np.array(
+        [
+            [c1 * c2 - s1 * s2 * c, s1 * c2 + c1 * s2 * c, s2 * s],
+            [-c1 * s2 - s1 * c2 * c, -s1 * s2 + c1 * c2 * c, c2 * s],
+            [s1 * s, -c1 * s, c],
+        ]
+    )
+
+
+def test_rotation_matrix_to_euler_round_trip():
+    angles = np.array([[0.1, 0.2, 0.3], [3.0, 1.5, 6.0], [5.5, 2.9, 0.01]])
+    R = np.array([_bunge_rotation_matrix(*x) for x in angles])
+
+    phi1, Phi, phi2 = rotation_matrix_to_euler(R, frame="passive")
+
+    np.testing.assert_allclose(np.column_stack([phi1, Phi, phi2]), angles)
+
+
+def test_rotation_matrix_to_euler_degenerate_Phi():
+    R = np.array([_bunge_rotation_matrix(1.0, 0.0, 0.0), np.eye(3)])
+
+    phi1, Phi, phi2 = rotation_matrix_to_euler(R, frame="passive")
+
+    np.testing.assert_allclose(phi1, [1.0, 0.0])
+    np.testing.assert_allclose(Phi, [0.0, 0.0])
+    np.testing.assert_allclose(phi2, [0.0, 0.0])
+
+
+def test_rotate_grains_skips_grains_without_z_extent():
+    # Grain 1 spans Z, grain 2 lies in a single Z plane
+    z = np.concatenate([np.linspace(0.0, 1e-4, 100), np.full(100, 5e-5)])
+    df = pd.DataFrame(
+        {
+            "Z (m)": z,
+            "Grain ID": np.repeat([1, 2], 100),
+            "phi1": np.zeros(200),
+            "Phi": np.zeros(200),
+            "phi2": np.zeros(200),
+        }
+    )
+
+    df = rotate_grains(df, [1, 2], 1e5, False, None, None, [2, 3, 4])
+
+    np.testing.assert_allclose(df["phi2"][:100], np.radians(z[:100] * 1e5))
+    np.testing.assert_allclose(df["phi2"][100:], 0.0)
+
+
+def _rotate_grains_brute_force(df, gids, misorientation, ref_or, ref_id):
+    """Rotate grains one at a time and match every rotated point to the nearest
+    reference orientation by comparing it with all references"""
+    df = df.copy()
+    for gid in gids:
+        grain_indices = np.flatnonzero(df["Grain ID"].to_numpy() == gid)
+        if gid == 0 or len(grain_indices) < 100:
+            continue
+        z = df["Z (m)"].to_numpy()[grain_indices]
+        lengths = z - z.min()
+        thetas = np.radians(lengths * misorientation)
+        df.loc[grain_indices, "phi2"] += thetas
+        orientations = df.loc[grain_indices, ["phi1", "Phi", "phi2"]].to_numpy()
+        norms = np.linalg.norm(orientations[:, None, :] - ref_or[None, :, :], axis=2)
+        df.loc[grain_indices, "Reference ID"] = ref_id[np.argmin(norms, axis=1)]
+        df.loc[grain_indices, "axis_dist"] = lengths
+        df.loc[grain_indices, "theta"] = np.degrees(thetas)
+    return df
+
+
+def test_rotate_grains_matches_brute_force_nearest_reference():
+    rng = np.random.default_rng(0)
+    ref_or = rng.uniform(0.0, np.pi, size=(50, 3))
+    ref_id = np.arange(50) + 1000
+
+    # Grains of different sizes, including grain ID 0, a nucleated (negative) grain,
+    # and a grain with fewer than 100 points, with their points interleaved so that
+    # each grain's points are not contiguous in the frame
+    grain_ids = np.repeat([3, -7, 0, 12, 5], [150, 120, 110, 200, 40])
+    grain_ids = grain_ids[rng.permutation(len(grain_ids))]
+    num_points = len(grain_ids)
+    orientations = ref_or[rng.integers(0, 50, num_points)]
+    df = pd.DataFrame(
+        {
+            "X (m)": rng.uniform(0.0, 1e-4, num_points),
+            "Y (m)": rng.uniform(0.0, 1e-4, num_points),
+            "Z (m)": rng.uniform(0.0, 1e-4, num_points),
+            "Grain ID": grain_ids,
+            "Reference ID": np.zeros(num_points, dtype=np.int64),
+            "phi1": orientations[:, 0],
+            "Phi": orientations[:, 1],
+            "phi2": orientations[:, 2],
+            "axis_dist": np.zeros(num_points),
+            "theta": np.zeros(num_points),
+        }
+    )
+    gids = df["Grain ID"].value_counts(sort=True).index.to_numpy()
+    expected = _rotate_grains_brute_force(df, gids, 2e4, ref_or, ref_id)
+
+    df = rotate_grains(df, gids, 2e4, True, ref_or, ref_id, [5, 6, 7])
+
+    for col in ["phi2", "axis_dist", "theta"]:
+        np.testing.assert_allclose(df[col], expected[col])
+    np.testing.assert_array_equal(df["Reference ID"], expected["Reference ID"])
+    # Grain ID 0 and the grain with fewer than 100 points are not rotated
+    unrotated = np.isin(grain_ids, [0, 5])
+    np.testing.assert_array_equal(df["Reference ID"][unrotated], 0)
+    assert np.any(df["Reference ID"][~unrotated] != 0)
@@ -0,0 +1,74 @@
+#
+# Copyright (c) Oak Ridge National Laboratory.
+#
+# This file is part of Myna. For details, see the top-level license
+# at https://github.com/ORNL-MDF/Myna/LICENSE.md.
+#
+# License: 3-clause BSD, see https://opensource.org/licenses/BSD-3-Clause.
+#
+import threading
+from types import SimpleNamespace
+
+import pytest
+
+import myna.application.openfoam.mesh_part_vtk.app as mesh_part_vtk_app_module
+from myna.application.openfoam.mesh_part_vtk import OpenFOAMMeshPartVTK
+
+
+def _create_mesh_part_vtk_app(monkeypatch, tmp_path, myna_files, **args):
+    app = object.__new__(OpenFOAMMeshPartVTK)
+    app.input_file = str(tmp_path / "input.yaml")
+    app.args = SimpleNamespace(
+        **{"overwrite": False, "batch": False, "maxproc": 1, "np": 1, **args}
+    )
+    monkeypatch.setattr(app, "parse_execute_arguments", lambda: None)
+    monkeypatch.setattr(app, "get_step_output_paths", lambda: myna_files)
+    monkeypatch.setattr(
+        app,
+        "get_case_dirs",
+        lambda output_paths=None: [str(tmp_path / f"case-{i}") for i in range(3)],
+    )
+    return app
+
+
+@pytest.mark.parametrize(
+    "overwrite, batch, expected_cases",
+    [
+        (False, False, [1, 2]),
+        (True, False, [0, 1, 2]),
+        (False, True, [1, 2]),
+        (True, True, [0, 1, 2]),
+    ],
+)
+def test_mesh_part_vtk_execute_skips_existing_outputs(
+    monkeypatch, tmp_path, overwrite, batch, expected_cases
+):
+    myna_files = [str(tmp_path / f"case-{i}" / "part.vtk") for i in range(3)]
+    (tmp_path / "case-0").mkdir()
+    (tmp_path / "case-0" / "part.vtk").write_text("vtk", encoding="utf-8")
+    app = _create_mesh_part_vtk_app(
+        monkeypatch, tmp_path, myna_files, overwrite=overwrite, batch=batch, maxproc=4
+    )
+
+    meshed = []
+    threads = set()
+
+    def mesh_case(myna_file, case_dir):
+        meshed.append(myna_files.index(myna_file))
+        threads.add(threading.get_ident())
+
+    removed = []
+    monkeypatch.setattr(app, "mesh_case", mesh_case)
+    monkeypatch.setattr(
+        mesh_part_vtk_app_module.mesh,
+        "remove_paths",
+        lambda paths: removed.append(paths),
+    )
+    (tmp_path / "part.obj").write_text("obj", encoding="utf-8")
+
+    app.execute()
+
+    assert sorted(meshed) == expected_cases
+    assert (threading.get_ident() not in threads) == batch
+    # The exported OBJ files are cleaned up once, after all cases are meshed
+    assert removed == [[str(tmp_path / "part.obj")]]
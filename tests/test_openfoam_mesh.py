@@ -0,0 +1,270 @@
+#
+# Copyright (c) Oak Ridge National Laboratory.
+#
+# This file is part of Myna. For details, see the top-level license
+# at https://github.com/ORNL-MDF/Myna/LICENSE.md.
+#
+# License: 3-clause BSD, see https://opensource.org/licenses/BSD-3-Clause.
+#
+import os
+import pathlib
+
+import numpy as np
+import vtk
+
+from myna.application.openfoam import mesh
+from myna.application.openfoam.mesh import write_adamantine_vtk
+
+
+def _write_foam_list(path, foam_class, entries):
+    header = (
+        f"FoamFile {{ version 2.0; format ascii; class {foam_class}; "
+        f"object {path.name}; }}\n"
+    )
+    body = f"{len(entries)}\n(\n" + "\n".join(entries) + "\n)\n"
+    path.write_text(header + body, encoding="utf-8")
+
+
+def _write_unit_hex_case(case_dir):
+    """Write an OpenFOAM case with a single unit hexahedron cell"""
+    (case_dir / "system").mkdir(parents=True)
+    (case_dir / "system" / "controlDict").write_text(
+        "FoamFile { version 2.0; format ascii; class dictionary; object controlDict; }\n"
+        "startTime 0; endTime 1; deltaT 1; writeInterval 1;\n",
+        encoding="utf-8",
+    )
+    polymesh = case_dir / "constant" / "polyMesh"
+    polymesh.mkdir(parents=True)
+    points = [(x, y, z) for z in (0, 1) for y in (0, 1) for x in (0, 1)]
+    faces = [
+        (0, 4, 6, 2),
+        (1, 3, 7, 5),
+        (0, 1, 5, 4),
+        (2, 6, 7, 3),
+        (0, 2, 3, 1),
+        (4, 5, 7, 6),
+    ]
+    _write_foam_list(
+        polymesh / "points", "vectorField", [f"({x} {y} {z})" for x, y, z in points]
+    )
+    _write_foam_list(
+        polymesh / "faces",
+        "faceList",
+        [f"4({' '.join(map(str, face))})" for face in faces],
+    )
+    _write_foam_list(polymesh / "owner", "labelList", ["0"] * len(faces))
+    _write_foam_list(polymesh / "neighbour", "labelList", [])
+    _write_foam_list(
+        polymesh / "boundary",
+        "polyBoundaryMesh",
+        ["walls { type wall; nFaces 6; startFace 0; }"],
+    )
+
+
+def test_write_adamantine_vtk_writes_points_cells_and_types(tmp_path):
+    points = vtk.vtkPoints()
+    for point in [(0, 0, 0), (1, 0, 0), (0, 1, 0), (0, 0, 1), (1, 1, 1)]:
+        points.InsertNextPoint(point)
+    grid = vtk.vtkUnstructuredGrid()
+    grid.SetPoints(points)
+    grid.InsertNextCell(vtk.VTK_TETRA, 4, [0, 1, 2, 3])
+    grid.InsertNextCell(vtk.VTK_TRIANGLE, 3, [1, 2, 4])
+    vtk_file = tmp_path / "mesh.vtk"
+
+    write_adamantine_vtk(grid, vtk_file, precision=2)
+
+    assert vtk_file.read_text(encoding="utf-8") == (
+        "# vtk DataFile Version 3.0\n"
+        "****\n"
+        "ASCII\n"
+        "DATASET UNSTRUCTURED_GRID\n"
+        "POINTS 5 float\n"
+        "0.00 0.00 0.00\n"
+        "1.00 0.00 0.00\n"
+        "0.00 1.00 0.00\n"
+        "0.00 0.00 1.00\n"
+        "1.00 1.00 1.00\n"
+        "CELLS 2 9\n"
+        "4 0 1 2 3\n"
+        "3 1 2 4\n"
+        "CELL_TYPES 2\n"
+        "10\n"
+        "5\n"
+    )
+
+
+def test_write_cells_writes_mixed_cells_in_chunks(tmp_path):
+    offsets = np.array([0, 4, 7, 11])
+    connectivity = np.array([0, 1, 2, 3, 1, 2, 4, 5, 6, 7, 8])
+    cell_sizes = np.diff(offsets)
+    for chunk_size in [1, 2, 3]:
+        cell_file = tmp_path / f"cells-{chunk_size}.txt"
+        with open(cell_file, "w", encoding="utf-8") as f:
+            mesh._write_cells(f, offsets, connectivity, cell_sizes, chunk_size)
+
+        assert cell_file.read_text(encoding="utf-8") == (
+            "4 0 1 2 3\n3 1 2 4\n4 5 6 7 8\n"
+        )
+
+
+def test_foam_to_adamantine_reads_hex_mesh_without_foam_to_vtk(monkeypatch, tmp_path):
+    case_dir = tmp_path / "case"
+    _write_unit_hex_case(case_dir)
+
+    def fail_run_command(*args, **kwargs):
+        raise AssertionError("foamToVTK should not run for an all-hex mesh")
+
+    monkeypatch.setattr(mesh, "run_command", fail_run_command)
+
+    vtk_file = mesh.foam_to_adamantine(str(case_dir), precision=1)
+
+    lines = pathlib.Path(vtk_file).read_text(encoding="utf-8").splitlines()
+    assert lines[4] == "POINTS 8 float"
+    assert lines[13] == "CELLS 1 9"
+    assert sorted(int(x) for x in lines[14].split()[1:]) == list(range(8))
+    assert lines[15:] == ["CELL_TYPES 1", "12"]
+    assert not (case_dir / "case.foam").exists()
+
+
+def test_update_parameters_sets_existing_entries_in_process(monkeypatch, tmp_path):
+    foamdict_file = tmp_path / "refineMeshDict"
+    foamdict_file.write_text(
+        '#includeEtc "caseDicts/mesh/generation/snappyHexMeshDict.cfg"\n'
+        "nx              1;\n"
+        "geometry\n{\n    box // refinement box\n    {\n"
+        "        min             ( 0 0 0 );\n        max             ( 1 1 1 );\n"
+        "    }\n}\n"
+        "castellatedMeshControls\n{\n"
+        '    features        ( { file "part.eMesh"; level 0; } );\n}\n',
+        encoding="utf-8",
+    )
+    commands = []
+    monkeypatch.setattr(
+        mesh.subprocess, "run", lambda args, **kwargs: commands.append(args)
+    )
+
+    mesh.update_parameters(
+        str(foamdict_file),
+        {
+            "nx": 20,
+            "geometry/box/max": "( 2 2 2 )",
+            "castellatedMeshControls/features": "( )",
+            "castellatedMeshControls/maxLocalCells": 1000,
+        },
+    )
+
+    assert foamdict_file.read_text(encoding="utf-8") == (
+        '#includeEtc "caseDicts/mesh/generation/snappyHexMeshDict.cfg"\n'
+        "nx              20;\n"
+        "geometry\n{\n    box // refinement box\n    {\n"
+        "        min             ( 0 0 0 );\n        max             ( 2 2 2 );\n"
+        "    }\n}\n"
+        "castellatedMeshControls\n{\n"
+        "    features        ( );\n}\n"
+    )
+    assert commands == [
+        [
+            "foamDictionary",
+            "-entry",
+            "castellatedMeshControls/maxLocalCells",
+            "-set",
+            "1000",
+            str(foamdict_file),
+        ]
+    ]
+
+
+def test_mesh_bounding_box_reads_points_rewritten_in_place(tmp_path):
+    case_dir = tmp_path / "case"
+    _write_unit_hex_case(case_dir)
+    points_file = case_dir / "constant" / "polyMesh" / "points"
+
+    first = mesh.get_mesh_bounding_box(str(case_dir))
+    # Rewrite the points with the same size and modification time, as transformPoints
+    # can on filesystems with coarse timestamps
+    stat = points_file.stat()
+    points_file.write_text(
+        points_file.read_text(encoding="utf-8").replace(" 1)", " 9)"),
+        encoding="utf-8",
+    )
+    os.utime(points_file, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+    second = mesh.get_mesh_bounding_box(str(case_dir))
+
+    np.testing.assert_array_equal(first, [[0, 0, 0], [1, 1, 1]])
+    np.testing.assert_array_equal(second, [[0, 0, 0], [1, 1, 9]])
+
+
+def test_read_mesh_points_reads_binary_points(tmp_path):
+    polymesh = tmp_path / "constant" / "polyMesh"
+    polymesh.mkdir(parents=True)
+    points = np.array([[0.0, 0.5, 1.0], [2.0, -3.0, 4e-6]])
+    (polymesh / "points").write_bytes(
+        b"FoamFile\n{\n    format binary;\n    class vectorField;\n"
+        b'    arch "LSB;label=32;scalar=64";\n}\n'
+        b"// * * * //\n\n2\n(" + points.astype("<f8").tobytes() + b")\n"
+    )
+
+    np.testing.assert_array_equal(mesh.read_mesh_points(str(tmp_path)), points)
+
+
+def test_set_snappy_max_local_cells_splits_global_cells(tmp_path):
+    snappy_dict = tmp_path / "refineMeshDict"
+    snappy_dict.write_text(
+        "castellatedMeshControls\n{\n"
+        "    maxLocalCells   100000;\n    maxGlobalCells  2e6;\n}\n",
+        encoding="utf-8",
+    )
+    args = ["snappyHexMesh", "-dict", str(snappy_dict), "-overwrite"]
+
+    mesh.set_snappy_max_local_cells(args, str(tmp_path), 8)
+
+    assert mesh.get_parameter(
+        str(snappy_dict), "castellatedMeshControls/maxLocalCells"
+    ) == str(250000)
+
+
+def test_remove_paths_removes_files_and_directories(tmp_path):
+    for i in range(3):
+        (tmp_path / f"processor{i}" / "constant").mkdir(parents=True)
+    (tmp_path / "cellLevel").write_text("0\n", encoding="utf-8")
+    paths = [str(p) for p in tmp_path.iterdir()] + [str(tmp_path / "missing")]
+
+    mesh.remove_paths(paths)
+
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_translate_mesh_z_skips_aligned_mesh(monkeypatch):
+    commands = []
+    monkeypatch.setattr(
+        mesh, "run_command", lambda args, **kwargs: commands.append(args)
+    )
+
+    mesh.translate_mesh_z("case", 0.0)
+    mesh.translate_mesh_z("case", -0.5)
+
+    assert commands == [["transformPoints", "-case", "case", "translate=(0 0 -0.5)"]]
+
+
+def test_get_mesh_n_cells_reads_owner_header(tmp_path):
+    polymesh = tmp_path / "constant" / "polyMesh"
+    polymesh.mkdir(parents=True)
+    owner_file = polymesh / "owner"
+    owner_file.write_text(
+        "FoamFile\n{\n    format ascii;\n    class labelList;\n"
+        '    note "nPoints:8 nCells:1 nFaces:6 nInternalFaces:0";\n'
+        "    object owner;\n}\n6\n(\n0\n0\n0\n0\n0\n0\n)\n",
+        encoding="utf-8",
+    )
+
+    assert mesh.get_mesh_n_cells(str(tmp_path)) == 1
+
+    # A header rewritten in place with the same size and modification time is reread
+    stat = owner_file.stat()
+    owner_file.write_text(
+        owner_file.read_text(encoding="utf-8").replace("nCells:1 ", "nCells:7 "),
+        encoding="utf-8",
+    )
+    os.utime(owner_file, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+    assert mesh.get_mesh_n_cells(str(tmp_path)) == 7
+    assert mesh.get_mesh_n_cells(str(tmp_path / "missing")) is None
@@ -13,7 +13,12 @@ import pandas as pd
 import polars as pl
 import pytest
 
-from myna.application.thesis import read_parameter, update_domain_resolution
+from myna.application.thesis import (
+    Path,
+    adjust_parameters,
+    read_parameter,
+    update_domain_resolution,
+)
 from myna.application.thesis.depth_map_part import ThesisDepthMapPart
 from myna.application.thesis.melt_pool_geometry_part import ThesisMeltPoolGeometryPart
 from myna.application.thesis.solidification_build_region import (
@@ -723,3 +728,60 @@ def test_temperature_run_case_reuses_existing_results_unless_overwriting(
 
     assert result_file.endswith("thermal_3dthesis.Snapshot.3.csv")
     assert proc_list == ["ran"]
+
+
+def test_path_load_data_computes_scan_times_and_segments(tmp_path):
+    scanpath = tmp_path / "scanpath.txt"
+    _write_scanfile(
+        scanpath,
+        rows=["0.0\t0.0\t1\t0\t0.5", "3.0\t4.0\t0\t370\t1.0", "3.0\t4.0\t1\t0\t0.25"],
+    )
+
+    path = Path()
+    path.loadData(str(scanpath))
+
+    assert path.data["time"].tolist() == pytest.approx([0.5, 0.505, 0.755])
+    assert path.data["xs"].tolist() == [0.0, 0.0, 3.0]
+    assert path.data["ys"].tolist() == [0.0, 0.0, 4.0]
+    assert path.data["xe"].tolist() == [0.0, 3.0, 3.0]
+    assert path.data["ye"].tolist() == [0.0, 4.0, 4.0]
+    assert path.end == pytest.approx(0.755)
+
+    location, index = path.getLocation(0.5025)
+    assert index == 1
+    assert location == pytest.approx([1.5, 2.0])
+    location, index = path.getLocation(0.25)
+    assert index == 0
+    assert location == pytest.approx([0.0, 0.0])
+
+
+def test_path_get_index_finds_active_command(tmp_path):
+    scanpath = tmp_path / "scanpath.txt"
+    _write_scanfile(
+        scanpath,
+        rows=[
+            "0.0\t0.0\t1\t0\t0.5",
+            "0.0\t0.0\t1\t0\t0.0",
+            "3.0\t4.0\t0\t370\t1.0",
+            "3.0\t4.0\t1\t0\t0.25",
+        ],
+    )
+
+    path = Path()
+    path.loadData(str(scanpath))
+
+    assert [path.getIndex(t) for t in [0.25, 0.5, 0.502, 0.6, 1.0]] == [0, 0, 2, 3, 3]
+
+
+def test_adjust_parameters_updates_all_keywords(tmp_path):
+    beam_file = tmp_path / "Beam.txt"
+    beam_file.write_text(
+        "Shape\n{\n\tWidth_X\t1\n\tWidth_Y\t1\n}\nBeam\n{\n\tPower\t100\n}",
+        encoding="utf-8",
+    )
+
+    adjust_parameters(beam_file, {"Width_X": 2e-5, "Width_Y": 3e-5, "Power": 250})
+
+    assert read_parameter(beam_file, "Width_X") == ["2e-05"]
+    assert read_parameter(beam_file, "Width_Y") == ["3e-05"]
+    assert read_parameter(beam_file, "Power") == ["250"]